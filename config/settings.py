@@ -27,6 +27,7 @@ CONTACTS_DIR = PROJECT_ROOT / "contacts"
 OUTREACH_DIR = PROJECT_ROOT / "outreach"
 DRAFTS_DIR = OUTREACH_DIR / "drafts"
 CONFIG_DIR = PROJECT_ROOT / "config"
+CACHE_DIR = PROJECT_ROOT / "cache"
 
 # Input files
 NICHES_FILE = INPUT_DIR / "niches.txt"
@@ -38,6 +39,10 @@ SHOPIFY_SITES_FILE = VERIFICATION_DIR / "shopify_sites.json"
 AUDIT_RESULTS_FILE = AUDITS_DIR / "audit_results.json"
 CONTACTS_FILE = CONTACTS_DIR / "contacts.json"
 
+# Cache files (safe to delete; rebuilt on the next run)
+BROWSER_PROFILE_DIR = CACHE_DIR / "chromium-profile"
+CONTACTS_HTTP_CACHE_FILE = CACHE_DIR / "contacts_http.sqlite3"
+
 # =============================================================================
 # RATE LIMITING & SAFETY
 # =============================================================================
@@ -60,6 +65,9 @@ REQUEST_TIMEOUT = 30
 # Maximum retries per request
 MAX_RETRIES = 3
 
+# Longest server Retry-After honoured before a retry (in seconds)
+MAX_RETRY_AFTER = 60
+
 # =============================================================================
 # PLAYWRIGHT SETTINGS
 # =============================================================================
@@ -99,6 +107,11 @@ SHOPIFY_SIGNALS = {
     "X-Shopify-Stage": 50,
 }
 
+# Safety limit on homepage bytes read while verifying. Pages are otherwise
+# read to the end unless the signals seen so far clear MIN_SHOPIFY_CONFIDENCE
+# first; a page cut off here without a verdict is reported as inconclusive
+VERIFY_MAX_PAGE_BYTES = 20_000_000
+
 # =============================================================================
 # GEMINI API SETTINGS
 # =============================================================================
@@ -152,6 +165,15 @@ EXCLUDED_EMAIL_PATTERNS = [
     "help@shopify.com",
 ]
 
+# How long a cached page is reused before it is revalidated (in seconds)
+HTTP_CACHE_EXPIRE = 86400
+
+# Most bytes read from one page; the rest of a larger response is skipped
+MAX_PAGE_BYTES = 2_000_000
+
+# Contact pages are not checked once the homepage yields this many emails
+ENOUGH_EMAILS = 3
+
 # =============================================================================
 # OUTREACH SETTINGS
 # =============================================================================
@@ -7,8 +7,12 @@ search results for given niche keywords using Playwright for reliable scraping.
 
 Features:
 - Uses Playwright for JavaScript-rendered search results
+- Extracts result links inside the browser with one page.evaluate call per page
 - Scrapes Google and DuckDuckGo
-- Applies strict rate limiting (≥10s between requests)
+- Searches engines and niches concurrently with async Playwright on a
+  persistent browser profile (cookies and HTTP cache survive between runs)
+- Applies strict per-engine rate limiting (≥10s between requests to one host),
+  backing off exponentially from an engine that starts blocking
 - Deduplicates domains
 - Outputs normalized URLs
 
@@ -19,20 +23,24 @@ If no niche is provided, reads from input/niches.txt
 """
 
 import sys
-import json
 import time
 import random
 import logging
+import os
 import argparse
+import asyncio
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse, urljoin, quote_plus, unquote
 from datetime import datetime, timezone
-from typing import List, Dict, Set, Optional
+from typing import BinaryIO, Iterable, Iterator, List, Dict, Set, Optional, Tuple
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+import tldextract
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -42,6 +50,7 @@ from config.settings import (
     NICHES_FILE,
     USER_AGENTS_FILE,
     DISCOVERED_SITES_FILE,
+    BROWSER_PROFILE_DIR,
     MIN_REQUEST_DELAY,
     MAX_REQUEST_DELAY,
     MAX_SITES_PER_NICHE,
@@ -176,6 +185,214 @@ SHOPIFY_STORE_DATABASE = {
     ],
 }
 
+
+def _niche_tokens(text: str) -> List[str]:
+    """Split a niche into lookup tokens, adding the singular of plural words."""
+    tokens = []
+    for word in text.lower().split():
+        tokens.append(word)
+        if len(word) > 3 and word.endswith("s"):
+            tokens.append(word[:-1])
+    return tokens
+
+
+# Database URLs per key with duplicates dropped, plus an inverted index from
+# each key token to the keys containing it (in database order)
+_DEDUPED_URLS_BY_KEY = {
+    key: tuple(dict.fromkeys(urls)) for key, urls in SHOPIFY_STORE_DATABASE.items()
+}
+_NICHE_INDEX: Dict[str, Tuple[str, ...]] = {}
+for _key in _DEDUPED_URLS_BY_KEY:
+    if _key == "default":
+        continue
+    for _token in dict.fromkeys(_niche_tokens(_key)):
+        _NICHE_INDEX[_token] = _NICHE_INDEX.get(_token, ()) + (_key,)
+del _key, _token
+
+
+def _database_urls(niche: str) -> List[str]:
+    """
+    Look up built-in database URLs for a niche, best match first.
+
+    Tries an exact key, then keys sharing words with the niche (keys
+    matching the most niche words first, then those with the fewest words
+    of their own left unmatched, then database order), then a key
+    containing the niche or contained in it, then the default list.
+
+    Args:
+        niche: Lowercased niche
+
+    Returns:
+        Deduplicated URLs
+    """
+    if niche in _DEDUPED_URLS_BY_KEY:
+        return list(_DEDUPED_URLS_BY_KEY[niche])
+
+    # Number of niche words (or their singulars) each key contains
+    hits: Dict[str, int] = {}
+    for word in dict.fromkeys(niche.split()):
+        for key in dict.fromkeys(key for token in _niche_tokens(word) for key in _NICHE_INDEX.get(token, ())):
+            hits[key] = hits.get(key, 0) + 1
+    if hits:
+        ranked = sorted(
+            (key for key in _DEDUPED_URLS_BY_KEY if key in hits),
+            key=lambda key: (-hits[key], len(key.split()) - hits[key]),
+        )
+        return list(dict.fromkeys(url for key in ranked for url in _DEDUPED_URLS_BY_KEY[key]))
+
+    # Partial match, e.g. "skin" -> "skincare"
+    for key, urls in _DEDUPED_URLS_BY_KEY.items():
+        if niche in key or key in niche:
+            return list(urls)
+    return list(_DEDUPED_URLS_BY_KEY.get("default", ()))
+
+# Social media, marketplaces, and other non-store sites, matched exactly
+# against the registered domain (eTLD+1) of each URL
+EXCLUDED_DOMAINS = frozenset({
+    # Social media
+    "facebook.com",
+    "instagram.com",
+    "twitter.com",
+    "youtube.com",
+    "pinterest.com",
+    "linkedin.com",
+    "tiktok.com",
+    "reddit.com",
+    "snapchat.com",
+    # Marketplaces
+    "amazon.com",
+    "ebay.com",
+    "etsy.com",
+    "alibaba.com",
+    "aliexpress.com",
+    "walmart.com",
+    "target.com",
+    # Search engines
+    "bing.com",
+    "google.com",
+    "duckduckgo.com",
+    "yahoo.com",
+    "baidu.com",
+    # Reference sites
+    "wikipedia.org",
+    "wikimedia.org",
+    "github.com",
+    "stackoverflow.com",
+    "medium.com",
+    "quora.com",
+    "zhihu.com",
+    # Website builders (competitors)
+    "wordpress.com",
+    "blogspot.com",
+    "tumblr.com",
+    "weebly.com",
+    "wix.com",
+    "squarespace.com",
+    # Tech companies
+    "microsoft.com",
+    "apple.com",
+    "adobe.com",
+    # Shipping
+    "usps.com",
+    "ups.com",
+    "fedex.com",
+    # News/Media
+    "crunchyroll.com",
+    "cbsnews.com",
+    "cnn.com",
+    "bbc.com",
+    "nytimes.com",
+    "forbes.com",
+    "businessinsider.com",
+    # Chinese sites
+    "163.com",
+    "qq.com",
+    "taobao.com",
+    "jd.com",
+    "weibo.com",
+    "bilibili.com",
+    "douyin.com",
+    # Shopify itself (not stores)
+    "shopify.com",
+    "shopify.dev",
+    "shopifycdn.com",
+    # Other non-stores
+    "trustpilot.com",
+    "yelp.com",
+    "glassdoor.com",
+    "indeed.com",
+    "craigslist.org",
+    "lenovo.com",
+    "dell.com",
+    "hp.com",
+    "samsung.com",
+    "lg.com",
+    "sony.com",
+    # Additional non-stores from testing
+    "freepik.com",
+    "openai.com",
+    "whatsapp.com",
+    "yandex.com",
+    "office.com",
+    "asus.com",
+    "about.google",
+    "translate.google",
+    "ok.ru",
+    "androidauthority.com",
+})
+
+# Brands excluded under any public suffix (e.g. google.co.uk, thefork.it)
+EXCLUDED_BRANDS = frozenset({
+    "google",
+    "amazon",
+    "ebay",
+    "facebook",
+    "instagram",
+    "youtube",
+    "pinterest",
+    "linkedin",
+    "tiktok",
+    "twitter",
+    "yahoo",
+    "bing",
+    "wikipedia",
+    "walmart",
+    "aliexpress",
+    "yandex",
+    "tripadvisor",
+    "thefork",
+    "allbiz",
+})
+
+# Government/Education suffix labels (e.g. .gov, .edu, .gov.uk)
+EXCLUDED_SUFFIX_LABELS = frozenset({"gov", "edu"})
+
+# Public-suffix aware domain splitter. Uses the suffix list snapshot bundled
+# with tldextract, so there is no download (or offline traceback) on first use
+TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+# Breadcrumb separators in display URLs (e.g., "site.com › path › page")
+_BREADCRUMB_RE = re.compile(r"\s*[›>]\s*")
+
+# Target URL inside a DuckDuckGo redirect link (/l/?uddg=<encoded url>&...)
+_UDDG_RE = re.compile(r"uddg=([^&]+)")
+
+# Host part of an absolute http(s) URL (everything up to the path/query/fragment)
+_NETLOC_RE = re.compile(r"https?://([^/?#]*)")
+
+# Resource types that never contribute to SERP link extraction
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+# Chromium flags that trim startup and rendering work for headless scraping
+BROWSER_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--mute-audio",
+    "--disable-extensions",
+    # Cap the profile's HTTP cache at 100 MB
+    "--disk-cache-size=104857600",
+]
+
 # Configure logging
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
@@ -195,7 +412,11 @@ def emit_progress(current: int, total: int, message: str = "") -> None:
             "total": total,
             "message": message or f"Processing {current}/{total}",
         }
-        print(json.dumps(progress_data), flush=True)
+        # The executor streams these lines to the UI live, so each one is
+        # flushed; text printed earlier is flushed first to keep line order
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(progress_data) + b"\n")
+        sys.stdout.buffer.flush()
 
 
 class UserAgentRotator:
@@ -216,6 +437,7 @@ class UserAgentRotator:
                 "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             ]
             logger.warning("No user agents loaded, using fallback")
+        self._ua_iter = iter(())
 
     def _load_user_agents(self, filepath: Path) -> List[str]:
         """Load user agents from file, ignoring comments and empty lines."""
@@ -232,40 +454,158 @@ class UserAgentRotator:
         return agents
 
     def get_random(self) -> str:
-        """Get a random user agent."""
-        return random.choice(self.user_agents)
+        """
+        Get a random user agent.
 
+        Walks a shuffled copy of the list and reshuffles once it is exhausted,
+        so every agent is used once per cycle instead of repeating at random.
+        """
+        try:
+            return next(self._ua_iter)
+        except StopIteration:
+            random.shuffle(self.user_agents)
+            self._ua_iter = iter(self.user_agents)
+            return next(self._ua_iter)
+
+
+class HostRateLimiter:
+    """
+    Per-host token bucket with exponential backoff after blocks.
 
-class RateLimiter:
-    """Enforces rate limiting between requests."""
+    Each host refills one token every `min_delay` seconds (plus a little
+    jitter), so engines are throttled independently. When an engine serves a
+    CAPTCHA/429, penalize() pushes its next request out with an exponentially
+    growing, jittered delay; reset() clears that once results come back.
+    """
 
-    def __init__(self, min_delay: float, max_delay: float):
+    def __init__(
+        self,
+        min_delay: float,
+        max_delay: float,
+        backoff_base: float = 5.0,
+        backoff_cap: float = 60.0,
+        max_attempts: int = 7,
+    ):
         """
         Initialize rate limiter.
 
         Args:
-            min_delay: Minimum seconds between requests
-            max_delay: Maximum seconds between requests
+            min_delay: Minimum seconds between requests to one host
+            max_delay: Maximum seconds between requests to one host
+            backoff_base: Backoff delay in seconds for the first block
+            backoff_cap: Upper bound in seconds for a single backoff delay
+            max_attempts: Consecutive blocks after which a host is given up on
+        """
+        self.refill_rate = 1.0 / min_delay  # tokens per second
+        self.jitter = max(0.0, max_delay - min_delay)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_attempts = max_attempts
+        self.buckets: Dict[str, Dict[str, float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _bucket(self, host: str) -> Dict[str, float]:
+        """Get (creating on first use) the bucket state for a host."""
+        if host not in self.buckets:
+            self.buckets[host] = {
+                "tokens": 1.0,
+                "last_refill": time.monotonic(),
+                "attempts": 0,
+                "blocked_until": 0.0,
+            }
+        return self.buckets[host]
+
+    async def acquire(self, host: str):
+        """
+        Wait until a request to a host is allowed, then take its token.
+
+        Sleeps with asyncio.sleep so other coroutines keep running, and holds
+        a per-host lock so concurrent callers are spaced out one by one.
+
+        Args:
+            host: Host the request is going to (e.g. "google.com")
+        """
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            bucket = self._bucket(host)
+            while True:
+                now = time.monotonic()
+                bucket["tokens"] = min(
+                    1.0, bucket["tokens"] + (now - bucket["last_refill"]) * self.refill_rate
+                )
+                bucket["last_refill"] = now
+                sleep_time = max(
+                    bucket["blocked_until"] - now,
+                    (1.0 - bucket["tokens"]) / self.refill_rate,
+                )
+                if sleep_time <= 0:
+                    break
+                sleep_time += random.uniform(0, self.jitter)
+                logger.debug(f"Rate limiting {host}: sleeping {sleep_time:.2f}s")
+                await asyncio.sleep(sleep_time)
+            bucket["tokens"] -= 1.0
+
+    def penalize(self, host: str):
+        """
+        Back off from a host after a CAPTCHA/429 response.
+
+        Args:
+            host: Host that blocked the request
         """
-        self.min_delay = min_delay
-        self.max_delay = max_delay
-        self.last_request_time = 0
+        bucket = self._bucket(host)
+        bucket["attempts"] = min(bucket["attempts"] + 1, self.max_attempts)
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** bucket["attempts"])
+        delay *= 0.5 + random.random()
+        bucket["blocked_until"] = time.monotonic() + delay
+        logger.warning(f"Backing off {host} for {delay:.1f}s (block #{bucket['attempts']})")
 
-    def wait(self):
-        """Wait appropriate time before next request."""
-        elapsed = time.time() - self.last_request_time
-        delay = random.uniform(self.min_delay, self.max_delay)
-        if elapsed < delay:
-            sleep_time = delay - elapsed
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+    def reset(self, host: str):
+        """Clear the backoff for a host after a successful request."""
+        self._bucket(host)["attempts"] = 0
 
+    def exhausted(self, host: str) -> bool:
+        """Whether a host has blocked us max_attempts times in a row."""
+        return self._bucket(host)["attempts"] >= self.max_attempts
 
+
+@functools.lru_cache(maxsize=100_000)
+def is_excluded_domain(domain: str) -> bool:
+    """
+    Check whether a host should never be treated as a store.
+
+    Hosts under an excluded domain (facebook.com, m.facebook.com, ...) are
+    caught by set lookups on their dotted suffixes. Anything else is split
+    once into subdomain/domain/suffix using the public suffix list, then
+    checked against brands and gov/edu suffixes.
+
+    Args:
+        domain: Lowercased host without "www."
+
+    Returns:
+        True if the host is excluded or has no public suffix
+    """
+    labels = domain.split(".")
+    if any(".".join(labels[i:]) in EXCLUDED_DOMAINS for i in range(len(labels) - 1)):
+        return True
+
+    ext = TLD_EXTRACT(domain)
+    if not ext.suffix:
+        return True
+    if f"{ext.domain}.{ext.suffix}" in EXCLUDED_DOMAINS:
+        return True
+    if ext.domain in EXCLUDED_BRANDS:
+        return True
+    return not EXCLUDED_SUFFIX_LABELS.isdisjoint(ext.suffix.split("."))
+
+
+@functools.lru_cache(maxsize=100_000)
 def normalize_url(url: str) -> Optional[str]:
     """
     Normalize URL to standard format.
 
+    Results are memoized: SERPs repeat the same hrefs many times and the
+    function is pure. Absolute http(s) links skip urlparse entirely.
+
     Args:
         url: Raw URL string
 
@@ -273,147 +613,93 @@ def normalize_url(url: str) -> Optional[str]:
         Normalized URL or None if invalid
     """
     try:
-        # Clean up breadcrumb-style URLs from search results (e.g., "site.com › path › page")
-        # These use › (U+203A) or > as path separators
-        if "›" in url or " > " in url:
-            # Replace breadcrumb separators with /
-            url = url.replace(" › ", "/").replace("›", "/")
-            url = url.replace(" > ", "/").replace(">", "/")
-            # Remove any remaining spaces
-            url = url.replace(" ", "")
-            # Remove trailing ellipsis
-            url = url.rstrip("…").rstrip(".")
-
-        # Skip URLs that are clearly not valid domains
-        if " " in url and "›" not in url and ">" not in url:
-            return None
-
-        # Add scheme if missing
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
-
-        parsed = urlparse(url)
-
-        # Validate domain
-        if not parsed.netloc:
-            return None
-
-        # Remove www. prefix for consistency
-        domain = parsed.netloc.lower()
-        if domain.startswith("www."):
-            domain = domain[4:]
-
-        # Skip social media, marketplaces, and non-store domains
-        excluded_domains = [
-            # Social media
-            "facebook.com",
-            "instagram.com",
-            "twitter.com",
-            "youtube.com",
-            "pinterest.com",
-            "linkedin.com",
-            "tiktok.com",
-            "reddit.com",
-            "snapchat.com",
-            # Marketplaces
-            "amazon.com",
-            "ebay.com",
-            "etsy.com",
-            "alibaba.com",
-            "aliexpress.com",
-            "walmart.com",
-            "target.com",
-            # Search engines
-            "bing.com",
-            "google.com",
-            "duckduckgo.com",
-            "yahoo.com",
-            "baidu.com",
-            # Reference sites
-            "wikipedia.org",
-            "wikimedia.org",
-            "github.com",
-            "stackoverflow.com",
-            "medium.com",
-            "quora.com",
-            "zhihu.com",
-            # Website builders (competitors)
-            "wordpress.com",
-            "blogspot.com",
-            "tumblr.com",
-            "weebly.com",
-            "wix.com",
-            "squarespace.com",
-            # Tech companies
-            "microsoft.com",
-            "apple.com",
-            "adobe.com",
-            # Shipping
-            "usps.com",
-            "ups.com",
-            "fedex.com",
-            # Government/Education
-            "gov",
-            "edu",
-            # News/Media
-            "crunchyroll.com",
-            "cbsnews.com",
-            "cnn.com",
-            "bbc.com",
-            "nytimes.com",
-            "forbes.com",
-            "businessinsider.com",
-            # Chinese sites
-            "163.com",
-            "qq.com",
-            "taobao.com",
-            "jd.com",
-            "weibo.com",
-            "bilibili.com",
-            "douyin.com",
-            # Shopify itself (not stores)
-            "shopify.com",
-            "shopify.dev",
-            "shopifycdn.com",
-            # Other non-stores
-            "trustpilot.com",
-            "yelp.com",
-            "glassdoor.com",
-            "indeed.com",
-            "craigslist.org",
-            "lenovo.com",
-            "dell.com",
-            "hp.com",
-            "samsung.com",
-            "lg.com",
-            "sony.com",
-            # Additional non-stores from testing
-            "freepik.com",
-            "tripadvisor",
-            "openai.com",
-            "whatsapp.com",
-            "yandex.com",
-            "office.com",
-            "asus.com",
-            "about.google",
-            "translate.google",
-            "ok.ru",
-            "androidauthority.com",
-            "thefork.",
-            "allbiz.",
-        ]
-        for excluded in excluded_domains:
-            if excluded in domain:
+        # Fast path: plain http(s) links (most SERP hrefs) have their host
+        # sliced out directly, without the cleanup steps or urlparse
+        match = _NETLOC_RE.match(url)
+        if match and " " not in url and "›" not in url:
+            netloc = match.group(1)
+        else:
+            # Clean up breadcrumb-style URLs from search results (e.g., "site.com › path › page")
+            # These use › (U+203A) or > as path separators
+            if "›" in url or " > " in url:
+                # Replace breadcrumb separators with / and drop remaining spaces
+                url = _BREADCRUMB_RE.sub("/", url).replace(" ", "")
+                # Remove trailing ellipsis
+                url = url.rstrip("…").rstrip(".")
+
+            # Skip URLs that are clearly not valid domains
+            if " " in url and "›" not in url and ">" not in url:
                 return None
 
-        # Return normalized URL (homepage only)
-        return f"https://{domain}"
+            # Add scheme if missing
+            if not url.startswith(("http://", "https://")):
+                url = "https://" + url
+
+            netloc = urlparse(url).netloc
+
+        return normalize_host(netloc)
 
     except Exception as e:
         logger.debug(f"URL normalization failed for {url}: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=100_000)
+def normalize_host(netloc: str) -> Optional[str]:
+    """
+    Turn a URL's host into a normalized homepage URL.
+
+    Args:
+        netloc: Host part of a URL (e.g. "www.Example.com")
+
+    Returns:
+        Normalized URL or None if empty or excluded
+    """
+    # Validate domain
+    if not netloc:
+        return None
+
+    # Remove www. prefix for consistency
+    domain = netloc.lower()
+    if domain.startswith("www."):
+        domain = domain[4:]
+
+    # Skip social media, marketplaces, and non-store domains
+    if is_excluded_domain(domain):
+        return None
+
+    # Return normalized URL (homepage only)
+    return f"https://{domain}"
+
+
+def normalize_urls(candidates: Iterable[str]) -> Set[str]:
+    """
+    Normalize a batch of raw hrefs/display URLs collected from one page.
+
+    Plain http(s) links are reduced to their hosts first, so a page with many
+    links to the same site normalizes and filters that host once; only
+    display-URL text (cites, breadcrumbs) goes through normalize_url.
+
+    Args:
+        candidates: Raw URL strings in discovery order
+
+    Returns:
+        Set of normalized URLs
+    """
+    urls = set()
+    hosts = set()
+    for candidate in set(candidates):
+        match = _NETLOC_RE.match(candidate)
+        if match and " " not in candidate and "›" not in candidate:
+            hosts.add(match.group(1))
+        else:
+            urls.add(normalize_url(candidate))
+    urls.update(map(normalize_host, hosts))
+    urls.discard(None)
+    return urls
+
+
+@functools.lru_cache(maxsize=100_000)
 def extract_domain(url: str) -> Optional[str]:
     """Extract domain from URL for deduplication."""
     normalized = normalize_url(url)
@@ -422,39 +708,302 @@ def extract_domain(url: str) -> Optional[str]:
     return None
 
 
-class SearchEngineScraper:
-    """Scrapes search engines for potential Shopify store URLs using Playwright."""
+def _block_heavy_resources(route) -> None:
+    """Abort requests for resources that are irrelevant to link extraction."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+# Tracking cookies cleared from an engine's context every COOKIE_RESET_INTERVAL
+# queries (consent cookies are kept so the consent dialog stays dismissed)
+COOKIE_RESET_INTERVAL = 20
+TRACKING_COOKIES = {
+    "google": ("NID", "1P_JAR", "AEC"),
+    "bing": ("MUID", "SRCHUID", "_EDGE_S"),
+    "duckduckgo": (),
+}
+
+# Cookie domains cleared when an engine starts serving CAPTCHAs
+ENGINE_COOKIE_DOMAINS = {
+    "google": re.compile(r"(^|\.)google\.com$"),
+    "bing": re.compile(r"(^|\.)bing\.com$"),
+    "duckduckgo": re.compile(r"(^|\.)duckduckgo\.com$"),
+}
+
+
+# CSS selector for the first organic result, used to know when a SERP is ready
+RESULT_SELECTORS = {
+    "google": "div#search a[href^='http']",
+    "duckduckgo": "a[data-testid='result-title-a']",
+    "bing": "li.b_algo",
+}
+
+
+# How much of a SERP's HTML is scanned for the blocking phrases below
+BLOCKING_SCAN_BYTES = 8192
+
+# Page text that indicates a search engine is blocking or rate limiting us
+BLOCKING_INDICATORS = {
+    "google": (
+        "unusual traffic",
+        "automated queries",
+        "captcha",
+        "verify you're not a robot",
+        "suspected automated",
+        "please verify",
+    ),
+    "duckduckgo": (
+        "rate limited",
+        "too many requests",
+        "please try again",
+        "automated queries",
+    ),
+    "bing": (
+        "unusual traffic",
+        "automated queries",
+        "verify you're human",
+        "captcha",
+    ),
+}
+
+
+# Result links and display-URL elements per engine, queried inside the page
+SERP_SELECTORS = {
+    "google": ("a[href^='http']", "cite"),
+    "duckduckgo": (
+        "a[href^='http']",
+        ".result__url, [data-testid='result-extras-url-link']",
+    ),
+    "bing": (
+        "li.b_algo h2 a[href^='http'], a[href^='http'][data-dt], a.b_algoLink",
+        "li.b_algo cite",
+    ),
+}
+
+# Candidates containing any of these are the engine's own pages, not results
+SERP_EXCLUDES = {
+    "google": ("google.com", "youtube.com", "webcache", "accounts.google"),
+    "duckduckgo": ("duckduckgo", "duck.co", "spreadprivacy"),
+    "bing": ("bing.com", "microsoft.com", "msn.com"),
+}
+
+# Runs in the page: returns only the strings we need, so the DOM never has to
+# be serialized and re-parsed in Python. The full HTML is sent back only when
+# nothing was found, for the debug dump.
+_EXTRACT_SERP_JS = """
+([linkSelector, textSelector, headSize]) => {
+    const hrefs = Array.from(document.querySelectorAll(linkSelector), a => a.getAttribute("href"));
+    const texts = Array.from(document.querySelectorAll(textSelector), e => e.textContent.trim());
+    const html = document.documentElement.outerHTML;
+    return {
+        title: document.title,
+        hrefs: hrefs,
+        texts: texts,
+        head: html.slice(0, headSize),
+        html: hrefs.length || texts.length ? null : html,
+    };
+}
+"""
 
-    def __init__(self, user_agent_rotator: UserAgentRotator, rate_limiter: RateLimiter):
+
+def serp_candidates(serp: Dict, engine: str) -> List[str]:
+    """Collect raw result URLs from extracted SERP links and display URLs."""
+    excluded = SERP_EXCLUDES[engine]
+    candidates = []
+    for value in serp["hrefs"] + serp["texts"]:
+        if not value:
+            continue
+        # Unwrap DDG redirect URLs first, then drop the engine's own pages
+        if "uddg=" in value:
+            match = _UDDG_RE.search(value)
+            if match:
+                value = unquote(match.group(1))
+        if not any(x in value for x in excluded):
+            candidates.append(value)
+    return candidates
+
+
+def parse_serp(serp: Dict, engine: str) -> Tuple[Set[str], str, bool]:
+    """
+    Turn the strings extracted from a results page into normalized store URLs.
+
+    Args:
+        serp: Result of _EXTRACT_SERP_JS (title, hrefs, texts, head, html)
+        engine: "google", "duckduckgo" or "bing"
+
+    Returns:
+        Tuple of (normalized URLs, page title, blocking detected)
+    """
+    page_title = serp["title"] or "No title"
+
+    # Block/CAPTCHA pages are tiny and say so near the top, so a substring
+    # check on the head of the raw HTML is enough
+    head = serp["head"].lower()
+    blocked = any(indicator in head for indicator in BLOCKING_INDICATORS[engine])
+
+    # Normalize every candidate in one batch
+    urls = normalize_urls(serp_candidates(serp, engine))
+    return urls, page_title, blocked
+
+
+class PlaywrightCluster:
+    """
+    One persistent Chromium profile shared by all search engines.
+
+    The profile directory keeps cookies (consent), the HTTP cache and
+    service workers between runs. Every job opens a fresh page in the
+    profile's context, and at most `max_pages` jobs run at the same time.
+    """
+
+    def __init__(self, user_agent_rotator: UserAgentRotator, max_pages: int = 3):
         """
-        Initialize scraper.
+        Initialize cluster.
 
         Args:
             user_agent_rotator: UserAgentRotator instance
-            rate_limiter: RateLimiter instance
+            max_pages: Number of pages (and so parallel jobs) open at once
         """
         self.ua_rotator = user_agent_rotator
-        self.rate_limiter = rate_limiter
+        self.max_pages = max(1, max_pages)
         self.playwright = None
-        self.browser = None
-
-    def _init_browser(self):
-        """Initialize Playwright browser if not already done."""
-        if self.browser is None:
-            self.playwright = sync_playwright().start()
-            self.browser = self.playwright.chromium.launch(headless=True)
-            logger.info("Playwright browser initialized")
-
-    def _close_browser(self):
-        """Close Playwright browser."""
-        if self.browser:
-            self.browser.close()
-            self.browser = None
+        self.context = None
+        self.job_counts: Dict[str, int] = {}
+        self._slots = asyncio.Semaphore(self.max_pages)
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        """Launch the browser on the persistent profile if not already done."""
+        async with self._lock:
+            if self.context is None:
+                BROWSER_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+                self.playwright = await async_playwright().start()
+                # One User-Agent per browser session: the pages share the
+                # context, and a per-job header would race between them and
+                # disagree with navigator.userAgent
+                self.context = await self.playwright.chromium.launch_persistent_context(
+                    str(BROWSER_PROFILE_DIR),
+                    headless=True,
+                    args=BROWSER_ARGS,
+                    user_agent=self.ua_rotator.get_random(),
+                    viewport={"width": 1280, "height": 800},
+                )
+                self.context.set_default_timeout(15000)
+                await self.context.route("**/*", _block_heavy_resources)
+                logger.info(f"Playwright browser initialized (profile: {BROWSER_PROFILE_DIR})")
+
+    async def run_job(self, key: str, fn, *args):
+        """
+        Run `fn(page, *args)` on a new page.
+
+        Waits for a free slot when `max_pages` jobs are already running.
+        Every COOKIE_RESET_INTERVAL jobs for a key (search engine), that
+        engine's tracking cookies are cleared; consent cookies are kept.
+
+        Args:
+            key: Search engine name
+            fn: Coroutine function taking a page as its first argument
+            *args: Extra arguments for fn
+
+        Returns:
+            Whatever fn returns
+        """
+        await self.start()
+        async with self._slots:
+            self.job_counts[key] = self.job_counts.get(key, 0) + 1
+            if self.job_counts[key] % COOKIE_RESET_INTERVAL == 0:
+                for name in TRACKING_COOKIES.get(key, ()):
+                    await self.context.clear_cookies(name=name)
+            page = await self.context.new_page()
+            try:
+                return await fn(page, *args)
+            finally:
+                await page.close()
+
+    async def reset(self, key: str):
+        """Drop all of a search engine's cookies (e.g. after a CAPTCHA)."""
+        if self.context is not None:
+            await self.context.clear_cookies(domain=ENGINE_COOKIE_DOMAINS[key])
+            logger.info(f"Cleared browser cookies for {key}")
+
+    async def close(self):
+        """Close the browser; the profile directory keeps its state on disk."""
+        if self.context:
+            await self.context.close()
+            self.context = None
         if self.playwright:
-            self.playwright.stop()
+            await self.playwright.stop()
             self.playwright = None
 
-    def search_google(self, query: str) -> Set[str]:
+
+class SearchEngineScraper:
+    """Scrapes search engines for potential Shopify store URLs using async Playwright."""
+
+    def __init__(
+        self,
+        user_agent_rotator: UserAgentRotator,
+        rate_limiter: HostRateLimiter,
+        concurrency: int = 3,
+    ):
+        """
+        Initialize scraper.
+
+        Args:
+            user_agent_rotator: UserAgentRotator instance
+            rate_limiter: HostRateLimiter instance
+            concurrency: Number of pages (and so parallel searches) open at once
+        """
+        self.rate_limiter = rate_limiter
+        self.cluster = PlaywrightCluster(user_agent_rotator, concurrency)
+
+    async def _wait_for_results(self, page, engine: str):
+        """Wait until the first organic result is in the DOM."""
+        try:
+            await page.wait_for_selector(RESULT_SELECTORS[engine], timeout=5000)
+        except PlaywrightTimeout:
+            # No results (or a block page) - give late scripts a moment
+            await asyncio.sleep(0.2)
+
+    async def _fetch_serp(self, search_url: str, engine: str, host: str) -> Tuple[Dict, Optional[int]]:
+        """
+        Take the host's rate-limit token, then load the results page.
+
+        The token is taken before waiting for a page slot, so an engine in
+        penalty backoff waits without holding a slot (and an open page) that
+        the other engines could be using.
+
+        Returns:
+            Tuple of (SERP dict from _EXTRACT_SERP_JS, HTTP status or None)
+        """
+        await self.rate_limiter.acquire(host)
+        return await self.cluster.run_job(engine, self._load_serp, search_url, engine)
+
+    async def _load_serp(self, page, search_url: str, engine: str) -> Tuple[Dict, Optional[int]]:
+        """
+        Open a results page on a fresh page (a PlaywrightCluster job).
+
+        Returns:
+            Tuple of (SERP dict from _EXTRACT_SERP_JS, HTTP status or None)
+        """
+        response = await page.goto(search_url, timeout=30000)
+        await page.wait_for_load_state("domcontentloaded")
+
+        # Handle Google's consent dialog if present
+        if engine == "google":
+            try:
+                consent_btn = page.locator("button:has-text('Accept all'), button:has-text('I agree')")
+                if await consent_btn.count() > 0:
+                    await consent_btn.first.click()
+            except:
+                pass
+
+        await self._wait_for_results(page, engine)
+        link_selector, text_selector = SERP_SELECTORS[engine]
+        serp = await page.evaluate(_EXTRACT_SERP_JS, [link_selector, text_selector, BLOCKING_SCAN_BYTES])
+        return serp, (response.status if response is not None else None)
+
+    async def search_google(self, query: str) -> Set[str]:
         """
         Search Google and extract URLs using Playwright.
 
@@ -467,94 +1016,34 @@ class SearchEngineScraper:
         urls = set()
         logger.info(f"Searching Google for: {query}")
 
-        self._init_browser()
-        self.rate_limiter.wait()
+        if self.rate_limiter.exhausted("google.com"):
+            logger.warning("Skipping Google: blocked too many times in a row")
+            return urls
 
         try:
-            context = self.browser.new_context(
-                user_agent=self.ua_rotator.get_random(),
-                viewport={"width": 1280, "height": 800}
-            )
-            page = context.new_page()
-
             # Go to Google
             search_url = f"https://www.google.com/search?q={quote_plus(query)}&num=30"
-            page.goto(search_url, timeout=30000)
-            page.wait_for_load_state("domcontentloaded")
-            time.sleep(2)  # Let results load
-
-            # Handle consent dialog if present
-            try:
-                consent_btn = page.locator("button:has-text('Accept all'), button:has-text('I agree')")
-                if consent_btn.count() > 0:
-                    consent_btn.first.click()
-                    time.sleep(1)
-            except:
-                pass
-
-            # Extract URLs from search results
-            html = page.content()
-            soup = BeautifulSoup(html, "html.parser")
+            serp, status = await self._fetch_serp(search_url, "google", "google.com")
+            html = serp["html"] or serp["head"]
+
+            urls, page_title, blocked = parse_serp(serp, "google")
+            # Results mean the engine is working, even if its page happens
+            # to mention a block indicator
+            if urls:
+                self.rate_limiter.reset("google.com")
+            elif blocked or status == 429:
+                self.rate_limiter.penalize("google.com")
+                await self.cluster.reset("google")
 
             # Debug: log page title to verify we're on Google results
-            page_title = soup.title.string if soup.title else "No title"
             logger.debug(f"Google page title: {page_title}")
 
             # Detect CAPTCHA or blocking
-            page_text = soup.get_text().lower()
-            if any(indicator in page_text for indicator in [
-                "unusual traffic",
-                "automated queries",
-                "captcha",
-                "verify you're not a robot",
-                "suspected automated",
-                "please verify"
-            ]):
+            if blocked:
                 logger.warning("Google CAPTCHA/blocking detected - search may return 0 results")
 
-            # Log HTML length for debugging
-            logger.debug(f"Google HTML length: {len(html)} chars")
-
-            # Google result selectors - multiple strategies for robustness
-
-            # Strategy 1: Look for search result containers with data-ved attribute (Google's tracking)
-            for result in soup.select("div[data-ved] a[href^='http']"):
-                href = result.get("href", "")
-                if href and not any(x in href for x in ["google.com", "youtube.com", "webcache", "accounts.google"]):
-                    normalized = normalize_url(href)
-                    if normalized:
-                        urls.add(normalized)
-                        logger.debug(f"Google strategy 1 found: {normalized}")
-
-            # Strategy 2: Look for links with jsname attribute (Google's JS framework)
-            for link in soup.select("a[jsname][href^='http']"):
-                href = link.get("href", "")
-                if href and not any(x in href for x in ["google.com", "youtube.com", "webcache", "accounts.google"]):
-                    normalized = normalize_url(href)
-                    if normalized:
-                        urls.add(normalized)
-                        logger.debug(f"Google strategy 2 found: {normalized}")
-
-            # Strategy 3: Generic http links (fallback)
-            for link in soup.select("a[href^='http']:not([href*='google'])"):
-                href = link.get("href", "")
-                if href and not any(x in href for x in ["google.com", "youtube.com", "webcache"]):
-                    normalized = normalize_url(href)
-                    if normalized:
-                        urls.add(normalized)
-
-            # Strategy 4: Check cite elements (display URLs) - FIXED: removed "›" exclusion
-            # The normalize_url function already handles breadcrumb-style URLs
-            for cite in soup.select("cite"):
-                text = cite.get_text().strip()
-                if text:
-                    # Pass the full text - normalize_url handles breadcrumb separators
-                    normalized = normalize_url(text)
-                    if normalized:
-                        urls.add(normalized)
-                        logger.debug(f"Google cite found: {normalized}")
-
-            context.close()
+            # Log candidate counts for debugging
+            logger.debug(f"Google links: {len(serp['hrefs'])}, display URLs: {len(serp['texts'])}")
 
         except PlaywrightTimeout:
             logger.warning(f"Timeout searching Google for: {query}")
@@ -576,7 +1065,7 @@ class SearchEngineScraper:
         logger.info(f"Google found {len(urls)} URLs for query")
         return urls
 
-    def search_duckduckgo(self, query: str) -> Set[str]:
+    async def search_duckduckgo(self, query: str) -> Set[str]:
         """
         Search DuckDuckGo and extract URLs using Playwright.
 
@@ -589,95 +1078,32 @@ class SearchEngineScraper:
         urls = set()
         logger.info(f"Searching DuckDuckGo for: {query}")
 
-        self._init_browser()
-        self.rate_limiter.wait()
+        if self.rate_limiter.exhausted("duckduckgo.com"):
+            logger.warning("Skipping DuckDuckGo: blocked too many times in a row")
+            return urls
 
         try:
-            context = self.browser.new_context(
-                user_agent=self.ua_rotator.get_random(),
-                viewport={"width": 1280, "height": 800}
-            )
-            page = context.new_page()
-
             # Go to DuckDuckGo
             search_url = f"https://duckduckgo.com/?q={quote_plus(query)}"
-            page.goto(search_url, timeout=30000)
-            page.wait_for_load_state("domcontentloaded")
-            time.sleep(3)  # Let JS render results
+            serp, status = await self._fetch_serp(search_url, "duckduckgo", "duckduckgo.com")
+            html = serp["html"] or serp["head"]
 
-            # Extract URLs from search results
-            html = page.content()
-            soup = BeautifulSoup(html, "html.parser")
+            urls, page_title, blocked = parse_serp(serp, "duckduckgo")
+            if urls:
+                self.rate_limiter.reset("duckduckgo.com")
+            elif blocked or status == 429:
+                self.rate_limiter.penalize("duckduckgo.com")
+                await self.cluster.reset("duckduckgo")
 
             # Debug: log page title to verify we're on DDG results
-            page_title = soup.title.string if soup.title else "No title"
             logger.debug(f"DuckDuckGo page title: {page_title}")
 
             # Detect rate limiting or blocking
-            page_text = soup.get_text().lower()
-            if any(indicator in page_text for indicator in [
-                "rate limited",
-                "too many requests",
-                "please try again",
-                "automated queries"
-            ]):
+            if blocked:
                 logger.warning("DuckDuckGo rate limiting detected - search may return 0 results")
 
-            # Log HTML length for debugging
-            logger.debug(f"DuckDuckGo HTML length: {len(html)} chars")
-
-            # DuckDuckGo result selectors - multiple strategies for robustness
-
-            # Strategy 1: Result title links (current DDG structure)
-            for link in soup.select("a[data-testid='result-title-a']"):
-                href = link.get("href", "")
-                if href and href.startswith("http"):
-                    # Handle DDG redirect URLs
-                    if "uddg=" in href:
-                        match = re.search(r"uddg=([^&]+)", href)
-                        if match:
-                            href = unquote(match.group(1))
-                    if "duckduckgo" not in href:
-                        normalized = normalize_url(href)
-                        if normalized:
-                            urls.add(normalized)
-                            logger.debug(f"DDG strategy 1 found: {normalized}")
-
-            # Strategy 2: Result links container (alternative selector)
-            for link in soup.select("article a[href^='http'], .result__a[href^='http']"):
-                href = link.get("href", "")
-                if href and "duckduckgo" not in href:
-                    if "uddg=" in href:
-                        match = re.search(r"uddg=([^&]+)", href)
-                        if match:
-                            href = unquote(match.group(1))
-                    normalized = normalize_url(href)
-                    if normalized:
-                        urls.add(normalized)
-                        logger.debug(f"DDG strategy 2 found: {normalized}")
-
-            # Strategy 3: Look for result URL display elements
-            for url_span in soup.select(".result__url, [data-testid='result-extras-url-link']"):
-                text = url_span.get_text().strip()
-                if text:
-                    normalized = normalize_url(text)
-                    if normalized:
-                        urls.add(normalized)
-                        logger.debug(f"DDG strategy 3 found: {normalized}")
-
-            # Strategy 4: Generic http links as fallback (but exclude DDG internals)
-            for link in soup.select("a[href^='http']"):
-                href = link.get("href", "")
-                if href and not any(x in href for x in ["duckduckgo.com", "duck.co", "spreadprivacy"]):
-                    if "uddg=" in href:
-                        match = re.search(r"uddg=([^&]+)", href)
-                        if match:
-                            href = unquote(match.group(1))
-                    normalized = normalize_url(href)
-                    if normalized:
-                        urls.add(normalized)
-
-            context.close()
+            # Log candidate counts for debugging
+            logger.debug(f"DuckDuckGo links: {len(serp['hrefs'])}, display URLs: {len(serp['texts'])}")
 
         except PlaywrightTimeout:
             logger.warning(f"Timeout searching DuckDuckGo for: {query}")
@@ -699,7 +1125,7 @@ class SearchEngineScraper:
         logger.info(f"DuckDuckGo found {len(urls)} URLs for query")
         return urls
 
-    def search_bing(self, query: str) -> Set[str]:
+    async def search_bing(self, query: str) -> Set[str]:
         """
         Search Bing and extract URLs using Playwright.
         Bing is generally less aggressive with bot detection.
@@ -713,75 +1139,31 @@ class SearchEngineScraper:
         urls = set()
         logger.info(f"Searching Bing for: {query}")
 
-        self._init_browser()
-        self.rate_limiter.wait()
+        if self.rate_limiter.exhausted("bing.com"):
+            logger.warning("Skipping Bing: blocked too many times in a row")
+            return urls
 
         try:
-            context = self.browser.new_context(
-                user_agent=self.ua_rotator.get_random(),
-                viewport={"width": 1280, "height": 800}
-            )
-            page = context.new_page()
-
             # Go to Bing
             search_url = f"https://www.bing.com/search?q={quote_plus(query)}&count=30"
-            page.goto(search_url, timeout=30000)
-            page.wait_for_load_state("domcontentloaded")
-            time.sleep(2)  # Let results load
+            serp, status = await self._fetch_serp(search_url, "bing", "bing.com")
+            html = serp["html"] or serp["head"]
 
-            # Extract URLs from search results
-            html = page.content()
-            soup = BeautifulSoup(html, "html.parser")
+            urls, page_title, blocked = parse_serp(serp, "bing")
+            if urls:
+                self.rate_limiter.reset("bing.com")
+            elif blocked or status == 429:
+                self.rate_limiter.penalize("bing.com")
+                await self.cluster.reset("bing")
 
             # Debug: log page title
-            page_title = soup.title.string if soup.title else "No title"
             logger.debug(f"Bing page title: {page_title}")
 
             # Detect blocking
-            page_text = soup.get_text().lower()
-            if any(indicator in page_text for indicator in [
-                "unusual traffic",
-                "automated queries",
-                "verify you're human",
-                "captcha"
-            ]):
+            if blocked:
                 logger.warning("Bing blocking detected - search may return 0 results")
 
-            logger.debug(f"Bing HTML length: {len(html)} chars")
-
-            # Bing result selectors - multiple strategies
-
-            # Strategy 1: Main result links with cite elements
-            for result in soup.select("li.b_algo"):
-                # Get the main link
-                link = result.select_one("h2 a")
-                if link:
-                    href = link.get("href", "")
-                    if href and href.startswith("http"):
-                        normalized = normalize_url(href)
-                        if normalized:
-                            urls.add(normalized)
-                            logger.debug(f"Bing strategy 1 found: {normalized}")
-
-                # Also check cite elements
-                cite = result.select_one("cite")
-                if cite:
-                    text = cite.get_text().strip()
-                    if text:
-                        normalized = normalize_url(text)
-                        if normalized:
-                            urls.add(normalized)
-
-            # Strategy 2: Generic http links with data-* attributes (Bing tracking)
-            for link in soup.select("a[href^='http'][data-dt], a.b_algoLink"):
-                href = link.get("href", "")
-                if href and not any(x in href for x in ["bing.com", "microsoft.com", "msn.com"]):
-                    normalized = normalize_url(href)
-                    if normalized:
-                        urls.add(normalized)
-                        logger.debug(f"Bing strategy 2 found: {normalized}")
-
-            context.close()
+            logger.debug(f"Bing links: {len(serp['hrefs'])}, display URLs: {len(serp['texts'])}")
 
         except PlaywrightTimeout:
             logger.warning(f"Timeout searching Bing for: {query}")
@@ -803,7 +1185,7 @@ class SearchEngineScraper:
         logger.info(f"Bing found {len(urls)} URLs for query")
         return urls
 
-    def discover_for_niche(self, niche: str, use_database: bool = False) -> Dict:
+    async def discover_for_niche(self, niche: str, use_database: bool = False) -> Dict:
         """
         Discover potential Shopify stores for a niche.
 
@@ -814,7 +1196,9 @@ class SearchEngineScraper:
         Returns:
             Dictionary with discovery results
         """
-        all_urls = set()
+        # Insertion-ordered and capped at MAX_SITES_PER_NICHE: one dedup
+        # structure shared by all engines that keeps the first URLs found
+        all_urls: Dict[str, None] = {}
         search_metadata = []
 
         # Use built-in database if requested or as fallback
@@ -822,20 +1206,8 @@ class SearchEngineScraper:
             logger.info(f"Using built-in Shopify store database for: {niche}")
             niche_lower = niche.lower()
 
-            # Try exact match first, then partial match, then default
-            if niche_lower in SHOPIFY_STORE_DATABASE:
-                db_urls = SHOPIFY_STORE_DATABASE[niche_lower]
-            else:
-                # Try partial match
-                db_urls = []
-                for key, urls in SHOPIFY_STORE_DATABASE.items():
-                    if niche_lower in key or key in niche_lower:
-                        db_urls.extend(urls)
-                        break
-                if not db_urls:
-                    db_urls = SHOPIFY_STORE_DATABASE.get("default", [])
-
-            all_urls.update(db_urls[:MAX_SITES_PER_NICHE])
+            db_urls = _database_urls(niche_lower)
+            all_urls.update(dict.fromkeys(db_urls[:MAX_SITES_PER_NICHE]))
             search_metadata.append({
                 "engine": "built_in_database",
                 "query": niche,
@@ -846,79 +1218,54 @@ class SearchEngineScraper:
             consecutive_failures = 0
             max_consecutive_failures = 3  # If 3 engines fail in a row, skip to database
 
-            try:
-                for template in SEARCH_QUERY_TEMPLATES[:2]:  # Limit to 2 templates to reduce blocking
-                    query = template.format(niche=niche)
-
-                    # Early exit if too many consecutive failures (likely all blocked)
-                    if consecutive_failures >= max_consecutive_failures:
-                        logger.warning(f"Search engines appear blocked ({consecutive_failures} consecutive failures), skipping to database")
-                        break
-
-                    # Search Bing first (less aggressive with blocking)
-                    bing_urls = self.search_bing(query)
-                    all_urls.update(bing_urls)
-                    search_metadata.append({
-                        "engine": "bing",
-                        "query": query,
-                        "results_count": len(bing_urls),
-                    })
-                    if len(bing_urls) == 0:
-                        consecutive_failures += 1
-                    else:
-                        consecutive_failures = 0
-
-                    # Check if we have enough results
-                    if len(all_urls) >= MAX_SITES_PER_NICHE:
-                        logger.info(f"Reached max sites limit ({MAX_SITES_PER_NICHE}) for niche")
-                        break
-
-                    # Search Google
-                    google_urls = self.search_google(query)
-                    all_urls.update(google_urls)
-                    search_metadata.append({
-                        "engine": "google",
-                        "query": query,
-                        "results_count": len(google_urls),
-                    })
-                    if len(google_urls) == 0:
-                        consecutive_failures += 1
-                    else:
-                        consecutive_failures = 0
-
-                    # Check if we have enough results
-                    if len(all_urls) >= MAX_SITES_PER_NICHE:
-                        logger.info(f"Reached max sites limit ({MAX_SITES_PER_NICHE}) for niche")
-                        break
-
-                    # Search DuckDuckGo
-                    ddg_urls = self.search_duckduckgo(query)
-                    all_urls.update(ddg_urls)
+            for template in SEARCH_QUERY_TEMPLATES[:2]:  # Limit to 2 templates to reduce blocking
+                query = template.format(niche=niche)
+
+                # Early exit if too many consecutive failures (likely all blocked)
+                if consecutive_failures >= max_consecutive_failures:
+                    logger.warning(f"Search engines appear blocked ({consecutive_failures} consecutive failures), skipping to database")
+                    break
+
+                # Search all three engines at once; each one has its own
+                # rate limit, so they don't slow each other down. An engine
+                # that raises counts as a failed search instead of taking
+                # the other two engines' results down with it
+                engine_results = await asyncio.gather(
+                    self.search_bing(query),
+                    self.search_google(query),
+                    self.search_duckduckgo(query),
+                    return_exceptions=True,
+                )
+                for engine, engine_urls in zip(("bing", "google", "duckduckgo"), engine_results):
+                    if isinstance(engine_urls, Exception):
+                        logger.warning(f"{engine} search failed for '{query}': {engine_urls}")
+                        engine_urls = set()
+                    for url in engine_urls:
+                        if len(all_urls) >= MAX_SITES_PER_NICHE:
+                            break
+                        all_urls[url] = None
                     search_metadata.append({
-                        "engine": "duckduckgo",
+                        "engine": engine,
                         "query": query,
-                        "results_count": len(ddg_urls),
+                        "results_count": len(engine_urls),
                     })
-                    if len(ddg_urls) == 0:
+                    if len(engine_urls) == 0:
                         consecutive_failures += 1
                     else:
                         consecutive_failures = 0
 
-                    # Limit total results per niche
-                    if len(all_urls) >= MAX_SITES_PER_NICHE:
-                        logger.info(f"Reached max sites limit ({MAX_SITES_PER_NICHE}) for niche")
-                        break
-
-            finally:
-                self._close_browser()
+                # Limit total results per niche
+                if len(all_urls) >= MAX_SITES_PER_NICHE:
+                    logger.info(f"Reached max sites limit ({MAX_SITES_PER_NICHE}) for niche")
+                    break
 
             # Fallback to database if no results from search engines
             if len(all_urls) == 0:
                 logger.warning("Search engines returned 0 results, using built-in database as fallback")
-                return self.discover_for_niche(niche, use_database=True)
+                return await self.discover_for_niche(niche, use_database=True)
 
-        # Convert to list and limit
-        urls_list = list(all_urls)[:MAX_SITES_PER_NICHE]
+        # Convert to list (already limited)
+        urls_list = list(all_urls)
 
         return {
             "niche": niche,
@@ -945,6 +1292,144 @@ def load_niches(filepath: Path) -> List[str]:
     return niches
 
 
+def append_checkpoint(f: BinaryIO, result: Dict) -> None:
+    """Append one niche result to an open JSONL checkpoint and flush it."""
+    f.write(orjson.dumps(result) + b"\n")
+    f.flush()
+
+
+def iter_checkpoint(filepath: Path) -> Iterator[Dict]:
+    """Yield per-niche results from a JSONL checkpoint, skipping truncated lines."""
+    with open(filepath, "rb") as f:
+        for line in f:
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping unreadable checkpoint line in {filepath}")
+
+
+def collapse_checkpoint(checkpoint_file: Path, output_file: Path, niche_order: Optional[List[str]] = None) -> Dict:
+    """
+    Write the final discoveries JSON (and its .meta.json sidecar) from a checkpoint.
+
+    Niches finish (and are checkpointed) in whatever order their searches
+    complete, so discoveries are written in input niche order instead; niches
+    not in niche_order (e.g. carried over by --append) come first, in
+    checkpoint order. Only line offsets are held in memory, so memory use
+    does not grow with the size of the results.
+
+    Args:
+        checkpoint_file: JSONL checkpoint holding every niche result
+        output_file: JSON file to write ({"metadata": ..., "discoveries": [...]})
+        niche_order: Niches in input order
+
+    Returns:
+        The metadata written to the output file
+    """
+    rank = {niche: idx for idx, niche in enumerate(niche_order or [])}
+    entries = []  # (rank, offset) of each readable checkpoint line
+    total_urls = 0
+    with open(checkpoint_file, "rb") as f:
+        offset = 0
+        for line in f:
+            try:
+                result = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping unreadable checkpoint line in {checkpoint_file}")
+            else:
+                entries.append((rank.get(result["niche"], -1), offset))
+                total_urls += result["total_urls"]
+            offset += len(line)
+    entries.sort(key=lambda entry: entry[0])
+    total_niches = len(entries)
+
+    metadata = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "total_niches": total_niches,
+        "total_urls": total_urls,
+    }
+
+    # Write to a temp file first so a crash never leaves a truncated output
+    tmp_file = output_file.with_suffix(".tmp")
+    with open(checkpoint_file, "rb") as f, open(tmp_file, "wb") as out:
+        out.write(b'{\n  "metadata": ' + orjson.dumps(metadata) + b',\n  "discoveries": [')
+        for idx, (_, offset) in enumerate(entries):
+            f.seek(offset)
+            out.write((b",\n    " if idx else b"\n    ") + f.readline().rstrip(b"\n"))
+        out.write(b"\n  ]\n}\n")
+    os.replace(tmp_file, output_file)
+
+    # Metadata sidecar, for consumers that read the JSONL records directly
+    output_file.with_suffix(".meta.json").write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    return metadata
+
+
+async def discover_all(
+    scraper: SearchEngineScraper,
+    niches: List[str],
+    existing_niches: Set[str],
+    checkpoint_file: Path,
+    use_database: bool = False,
+) -> None:
+    """
+    Discover sites for all niches concurrently, appending each result to the checkpoint.
+
+    Niches share the scraper's PlaywrightCluster; up to `max_pages` of
+    them are in flight at once and the per-host rate limiter keeps each
+    engine's request rate unchanged.
+
+    Args:
+        scraper: SearchEngineScraper instance
+        niches: Niche keywords to process, in order
+        existing_niches: Niches already discovered; skipped and kept up to date
+        checkpoint_file: JSONL file each finished niche is appended to
+        use_database: If True, use built-in database instead of search engines
+    """
+    # Launch the browser once up front and keep it warm for every niche,
+    # instead of paying the Chromium startup cost per niche
+    if not use_database:
+        await scraper.cluster.start()
+
+    # Checkpoint appends run on a background thread so the disk write
+    # overlaps with the searches still in flight
+    checkpoint = open(checkpoint_file, "ab")
+    checkpoint_writer = ThreadPoolExecutor(max_workers=1)
+
+    total_niches = len(niches)
+    finished = 0
+    slots = asyncio.Semaphore(scraper.cluster.max_pages)
+
+    async def discover_one(niche: str) -> None:
+        nonlocal finished
+        try:
+            if niche in existing_niches:
+                logger.info(f"Skipping already discovered niche: {niche}")
+                return
+
+            async with slots:
+                logger.info(f"=== Processing niche: {niche} ===")
+                try:
+                    result = await scraper.discover_for_niche(niche, use_database=use_database)
+                except Exception as e:
+                    logger.error(f"Error processing niche '{niche}': {e}")
+                    return
+
+            existing_niches.add(result["niche"])
+            checkpoint_writer.submit(append_checkpoint, checkpoint, result)
+            logger.info(f"Discovered {result['total_urls']} URLs for '{niche}'")
+        finally:
+            # Emit progress for pipeline
+            finished += 1
+            emit_progress(finished, total_niches, f"Discovered sites for '{niche}'")
+
+    try:
+        await asyncio.gather(*(discover_one(niche) for niche in niches))
+    finally:
+        await scraper.cluster.close()
+        checkpoint_writer.shutdown(wait=True)
+        checkpoint.close()
+
+
 def main():
     """Main entry point for site discovery."""
     parser = argparse.ArgumentParser(
@@ -965,8 +1450,32 @@ def main():
         action="store_true",
         help="Use built-in Shopify store database instead of search engines (recommended if search engines block)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=3,
+        help="Number of browser pages, and niches searched in parallel (default: 3)",
+    )
+    parser.add_argument(
+        "--merge-to-json",
+        action="store_true",
+        help="Only rebuild discovered_sites.json from discovered_sites.jsonl (no searching)",
+    )
     args = parser.parse_args()
 
+    # Results are streamed to a JSONL file, one niche per line, as they are
+    # found; discovered_sites.json is built from it at the end
+    checkpoint_file = DISCOVERED_SITES_FILE.with_suffix(".jsonl")
+
+    if args.merge_to_json:
+        if not checkpoint_file.exists():
+            logger.error(f"No results to merge: {checkpoint_file} not found")
+            sys.exit(1)
+        niche_order = [args.niche] if args.niche else load_niches(NICHES_FILE)
+        metadata = collapse_checkpoint(checkpoint_file, DISCOVERED_SITES_FILE, niche_order)
+        logger.info(f"Merged {metadata['total_niches']} niches into {DISCOVERED_SITES_FILE}")
+        return
+
     # Determine niches to process
     if args.niche:
         niches = [args.niche]
@@ -977,73 +1486,60 @@ def main():
             logger.error("No niches to process. Add niches to input/niches.txt")
             sys.exit(1)
 
+    # Drop repeated niches (keeping file order) so each one is searched once
+    niches = list(dict.fromkeys(niches))
+
     # Initialize components
     ua_rotator = UserAgentRotator(USER_AGENTS_FILE)
-    rate_limiter = RateLimiter(MIN_REQUEST_DELAY, MAX_REQUEST_DELAY)
-    scraper = SearchEngineScraper(ua_rotator, rate_limiter)
+    rate_limiter = HostRateLimiter(MIN_REQUEST_DELAY, MAX_REQUEST_DELAY)
+    scraper = SearchEngineScraper(ua_rotator, rate_limiter, args.concurrency)
+
+    # Each finished niche is appended to the JSONL file as soon as it is
+    # found, and the final JSON is built from it, so results are never held
+    # in memory and an interrupted run keeps its progress; --append picks up
+    # records a crashed run left behind
+    DISCOVERED_SITES_FILE.parent.mkdir(parents=True, exist_ok=True)
+    existing_niches = set()
+    if checkpoint_file.exists():
+        if args.append:
+            for result in iter_checkpoint(checkpoint_file):
+                existing_niches.add(result["niche"])
+            logger.info(f"Recovered {len(existing_niches)} niches from checkpoint {checkpoint_file}")
+        else:
+            checkpoint_file.unlink()
 
-    # Load existing data if appending
-    existing_data = {"discoveries": [], "metadata": {}}
+    # Load existing data if appending, carrying it into the checkpoint
     if args.append and DISCOVERED_SITES_FILE.exists():
         try:
-            with open(DISCOVERED_SITES_FILE, "r") as f:
-                existing_data = json.load(f)
+            with open(DISCOVERED_SITES_FILE, "rb") as f:
+                existing_data = orjson.loads(f.read())
             logger.info(f"Loaded existing data with {len(existing_data.get('discoveries', []))} discoveries")
-        except json.JSONDecodeError:
+            with open(checkpoint_file, "ab") as checkpoint:
+                for result in existing_data.get("discoveries", []):
+                    if result["niche"] not in existing_niches:
+                        append_checkpoint(checkpoint, result)
+                        existing_niches.add(result["niche"])
+        except orjson.JSONDecodeError:
             logger.warning("Could not parse existing file, starting fresh")
 
-    # Process each niche
-    discoveries = existing_data.get("discoveries", [])
-    existing_niches = {d["niche"] for d in discoveries}
+    asyncio.run(discover_all(scraper, niches, existing_niches, checkpoint_file, args.use_database))
 
-    total_niches = len(niches)
-    for idx, niche in enumerate(niches, 1):
-        # Emit progress for pipeline
-        emit_progress(idx, total_niches, f"Discovering sites for '{niche}'")
-
-        if niche in existing_niches and args.append:
-            logger.info(f"Skipping already discovered niche: {niche}")
-            continue
-
-        logger.info(f"=== Processing niche: {niche} ===")
-        try:
-            result = scraper.discover_for_niche(niche, use_database=args.use_database)
-            discoveries.append(result)
-            logger.info(f"Discovered {result['total_urls']} URLs for '{niche}'")
-        except Exception as e:
-            logger.error(f"Error processing niche '{niche}': {e}")
-            continue
-
-    # Prepare output
-    output = {
-        "metadata": {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "total_niches": len(discoveries),
-            "total_urls": sum(d["total_urls"] for d in discoveries),
-        },
-        "discoveries": discoveries,
-    }
-
-    # Ensure output directory exists
-    DISCOVERED_SITES_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write output
-    with open(DISCOVERED_SITES_FILE, "w") as f:
-        json.dump(output, f, indent=2)
+    # Write output from the checkpoint, in input niche order
+    checkpoint_file.touch()
+    metadata = collapse_checkpoint(checkpoint_file, DISCOVERED_SITES_FILE, niches)
 
     logger.info(f"Discovery complete. Results saved to {DISCOVERED_SITES_FILE}")
-    logger.info(f"Total unique URLs discovered: {output['metadata']['total_urls']}")
+    logger.info(f"Total unique URLs discovered: {metadata['total_urls']}")
 
     # Print summary
     print("\n" + "=" * 60)
     print("DISCOVERY SUMMARY")
     print("=" * 60)
-    for discovery in discoveries:
+    for discovery in iter_checkpoint(checkpoint_file):
         print(f"  {discovery['niche']}: {discovery['total_urls']} URLs")
     print("=" * 60)
-    print(f"Total: {output['metadata']['total_urls']} URLs")
+    print(f"Total: {metadata['total_urls']} URLs")
     print(f"Output: {DISCOVERED_SITES_FILE}")
 
-
 if __name__ == "__main__":
     main()
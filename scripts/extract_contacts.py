@@ -9,27 +9,37 @@ Features:
 - Checks /contact and /pages/contact pages
 - Extracts footer emails
 - Finds mailto: links
+- Parses pages with selectolax (Lexbor)
 - Extracts social media links (Instagram, Facebook)
 - Business contacts only - no guessing or enrichment
+- Processes many sites concurrently (asyncio + httpx over HTTP/2), rate limited per site
+- Appends each site to a JSONL checkpoint, so interrupted runs can --resume
+- Caches pages between runs and revalidates them with conditional GETs
 
 Usage:
     python scripts/extract_contacts.py [--url "https://example.com"]
 """
 
 import sys
-import json
 import time
 import random
 import logging
 import argparse
+import asyncio
+import multiprocessing
+import os
 import re
+import sqlite3
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Set, Optional
+from html import unescape
+from typing import BinaryIO, Iterable, Iterator, List, Dict, Set, Optional, Tuple
 from urllib.parse import urlparse, urljoin
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import orjson
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -39,6 +49,10 @@ from config.settings import (
     USER_AGENTS_FILE,
     SHOPIFY_SITES_FILE,
     CONTACTS_FILE,
+    CONTACTS_HTTP_CACHE_FILE,
+    HTTP_CACHE_EXPIRE,
+    MAX_PAGE_BYTES,
+    ENOUGH_EMAILS,
     CONTACT_PAGES,
     EXCLUDED_EMAIL_PATTERNS,
     MIN_REQUEST_DELAY,
@@ -68,22 +82,293 @@ def emit_progress(current: int, total: int, message: str = "") -> None:
             "total": total,
             "message": message or f"Processing {current}/{total}",
         }
-        print(json.dumps(progress_data), flush=True)
-
-# Email regex pattern
+        # The executor streams these lines to the UI live, so each one is
+        # flushed; text printed earlier is flushed first to keep line order
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(progress_data) + b"\n")
+        sys.stdout.buffer.flush()
+
+# Email regex pattern. Text scans run on the raw response bytes, so this
+# (like PHONE_PATTERN) is a bytes pattern; matches are pure ASCII. The
+# lookbehind only lets a match start at the beginning of a run of
+# local-part characters, instead of retrying from every character of every
+# word on the page.
 EMAIL_PATTERN = re.compile(
-    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+    rb"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+    re.IGNORECASE
+)
+
+# Social media profile links, one alternative per platform. Each platform
+# group wraps a "<platform>_user" group with the profile name, so a single
+# search per href tells both the platform (match.lastgroup) and the user.
+SOCIAL_UNION = re.compile(
+    r"(?:https?://)?(?:www\.)?(?:"
+    r"(?P<instagram>instagram\.com/(?P<instagram_user>[^/?\s]+))"
+    r"|(?P<facebook>facebook\.com/(?P<facebook_user>[^/?\s]+))"
+    r"|(?P<twitter>(?:twitter|x)\.com/(?P<twitter_user>[^/?\s]+))"
+    r"|(?P<linkedin>linkedin\.com/(?:company|in)/(?P<linkedin_user>[^/?\s]+))"
+    r"|(?P<tiktok>tiktok\.com/@(?P<tiktok_user>[^/?\s]+))"
+    r")",
     re.IGNORECASE
 )
 
-# Social media patterns
-SOCIAL_PATTERNS = {
-    "instagram": re.compile(r"(?:https?://)?(?:www\.)?instagram\.com/([^/?\s]+)", re.IGNORECASE),
-    "facebook": re.compile(r"(?:https?://)?(?:www\.)?facebook\.com/([^/?\s]+)", re.IGNORECASE),
-    "twitter": re.compile(r"(?:https?://)?(?:www\.)?(?:twitter|x)\.com/([^/?\s]+)", re.IGNORECASE),
-    "linkedin": re.compile(r"(?:https?://)?(?:www\.)?linkedin\.com/(?:company|in)/([^/?\s]+)", re.IGNORECASE),
-    "tiktok": re.compile(r"(?:https?://)?(?:www\.)?tiktok\.com/@([^/?\s]+)", re.IGNORECASE),
-}
+# Phone numbers in page text (US-style formats). The leading lookahead
+# gives the regex engine a first-character set, so it skips straight past
+# text that cannot start a number.
+PHONE_PATTERN = re.compile(
+    rb"(?=[+(0-9])(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}"
+)
+PHONE_STRIP = re.compile(rb"[^\d+]")
+
+# href values of <a> tags, for pages that are scanned without building a DOM.
+# Quoted values run to the closing quote (tel: links often contain spaces);
+# exactly one of the three groups matches. The attribute name must follow
+# whitespace, so data-href= and xlink:href= are not taken for href=
+HREF_PATTERN = re.compile(
+    rb"""<a\s(?:[^>]*?\s)?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+
+# Email local parts made only of hex digits (DSNs, tokens)
+HEX_LOCAL = re.compile(r"^[a-f0-9]+$")
+
+# Sentry ingest hosts such as o123456.ingest.sentry.io
+SENTRY_DOMAIN = re.compile(r"o\d+\.ingest\.")
+
+# Configured exclusions (EXCLUDED_EMAIL_PATTERNS), matched anywhere in the
+# address with one search; "(?!)" never matches if none are configured
+EXCLUDED_EMAIL_RE = re.compile(
+    "|".join(re.escape(pattern.lower()) for pattern in EXCLUDED_EMAIL_PATTERNS) or r"(?!)"
+)
+
+# File extensions that the email pattern picks up from asset names (logo@2x.png)
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg')
+
+# Obviously fake or placeholder addresses from theme demo content
+FAKE_EMAIL_INDICATORS = ('example.com', 'test.com', 'email.com', 'youremail', 'your@')
+
+# Technical/tracking service domains (Sentry, analytics, etc.); an address
+# is skipped when its domain is one of these or a subdomain of one
+TECHNICAL_EMAIL_DOMAINS = frozenset({
+    'sentry.io',
+    'segment.io',
+    'segment.com',
+    'mixpanel.com',
+    'amplitude.com',
+    'intercom.io',
+    'zendesk.com',
+    'freshdesk.com',
+    'klaviyo.com',
+    'mailchimp.com',
+    'sendgrid.net',
+    'postmarkapp.com',
+    'sparkpost.com',
+})
+
+
+def _is_technical_domain(domain: str) -> bool:
+    """Check a domain and each of its parent domains against TECHNICAL_EMAIL_DOMAINS."""
+    labels = domain.split('.')
+    return any('.'.join(labels[i:]) in TECHNICAL_EMAIL_DOMAINS for i in range(len(labels) - 1))
+
+
+def _is_valid_email(email: str) -> bool:
+    """Check if email is valid and not excluded."""
+    email_lower = email.lower()
+    local_part, _, domain_part = email_lower.partition('@')
+
+    # Check against excluded patterns
+    if EXCLUDED_EMAIL_RE.search(email_lower):
+        return False
+
+    # Skip image file extensions that might match email pattern
+    if email_lower.endswith(IMAGE_EXTENSIONS):
+        return False
+
+    # Skip obviously fake or placeholder emails
+    if any(indicator in email_lower for indicator in FAKE_EMAIL_INDICATORS):
+        return False
+
+    # Skip technical/tracking service emails (Sentry, analytics, etc.)
+    if _is_technical_domain(domain_part):
+        return False
+
+    # Skip emails with long hexadecimal strings (likely DSNs or tokens)
+    if len(local_part) > 20 and HEX_LOCAL.match(local_part):
+        return False
+
+    # Skip emails where domain contains numbers (often auto-generated)
+    # Allow common domains with numbers like o365.com but skip tracking pixels
+    if SENTRY_DOMAIN.match(domain_part):
+        return False
+
+    return True
+
+
+def _extract_emails_from_html(html: bytes) -> Dict[str, None]:
+    """Extract valid email addresses from raw HTML bytes, in page order."""
+    emails = {}
+
+    # Find all email patterns
+    matches = EMAIL_PATTERN.findall(html)
+    for match in matches:
+        email = match.decode("ascii")
+        if _is_valid_email(email):
+            emails[email.lower()] = None
+
+    return emails
+
+
+def _node_hrefs(node: LexborNode) -> Iterator[str]:
+    """Yield the href of every link under a parsed node."""
+    for link in node.css("a[href]"):
+        yield link.attributes.get("href") or ""
+
+
+def _scan_hrefs(html: bytes) -> Iterator[str]:
+    """Yield link hrefs straight from raw HTML, without parsing it."""
+    for groups in HREF_PATTERN.findall(html):
+        yield unescape(b"".join(groups).decode("utf-8", "replace"))
+
+
+def _walk_links(hrefs: Iterable[str]) -> Tuple[Dict[str, None], Dict[str, None], Dict[str, str]]:
+    """
+    Collect mailto: emails, tel: numbers and social profiles in one pass.
+
+    Args:
+        hrefs: Link targets of a page (or footer), in page order
+
+    Returns:
+        Tuple of (emails, phones, social links by platform), in page order
+    """
+    emails = {}
+    phones = {}
+    social_links = {}
+
+    for href in hrefs:
+        if href.startswith("mailto:"):
+            # Extract email from mailto link
+            email = href[len("mailto:"):].split("?")[0].strip()
+            if email and _is_valid_email(email):
+                emails[email.lower()] = None
+
+        elif href.startswith("tel:"):
+            phone = href[len("tel:"):].strip()
+            if phone:
+                phones[phone] = None
+
+        else:
+            match = SOCIAL_UNION.search(href)
+            if not match:
+                continue
+
+            platform = match.lastgroup
+            if platform in social_links:
+                continue  # Already found this platform
+
+            username = match.group(f"{platform}_user")
+            # Skip generic pages
+            if username.lower() not in ['share', 'sharer', 'intent', 'dialog']:
+                social_links[platform] = href
+
+    return emails, phones, social_links
+
+
+def _extract_phone_numbers(html: bytes) -> Dict[str, None]:
+    """Extract phone numbers from raw page bytes, in page order."""
+    phones = {}
+
+    # Look for common phone patterns in text
+    matches = PHONE_PATTERN.findall(html)
+    for phone in matches[:5]:  # Limit to avoid false positives
+        cleaned = PHONE_STRIP.sub(b"", phone)
+        if len(cleaned) >= 10:
+            phones[phone.strip().decode("ascii")] = None
+
+    return phones
+
+
+def _extract_from_page(url: str, hrefs: Iterable[str], html: bytes) -> Dict:
+    """Extract all contact info from a single page (or part of one)."""
+    link_emails, link_phones, social = _walk_links(hrefs)
+    return {
+        "emails": list({**_extract_emails_from_html(html), **link_emails}),
+        "social": social,
+        "phones": list({**_extract_phone_numbers(html), **link_phones}),
+    }
+
+
+def _extract_footer_contacts(tree: LexborHTMLParser, url: str) -> Dict:
+    """Extract contact info specifically from footer section."""
+    footer_info = {
+        "emails": [],
+        "social": {},
+        "phones": [],
+    }
+
+    # Find footer element
+    footer = tree.css_first("footer")
+    if not footer:
+        # Try common footer class names
+        footer = tree.css_first('[class*="footer" i]')
+
+    if footer:
+        # Work on the footer node in place. The text scans run over its
+        # visible text, where entities are already decoded, so addresses
+        # written as info&#64;shop.com are found too
+        footer_text = footer.text(separator=" ").replace("\xa0", " ")
+        info = _extract_from_page(url, _node_hrefs(footer), footer_text.encode())
+        footer_info["emails"] = info["emails"]
+        footer_info["social"] = info["social"]
+        footer_info["phones"] = info["phones"]
+
+    return footer_info
+
+
+def parse_page(html: bytes, url: str, include_footer: bool = False) -> Dict:
+    """
+    Parse one page and extract its contact info.
+
+    Kept at module level and free of extractor state so it can run in a
+    worker process.
+
+    Args:
+        html: Raw page HTML, as downloaded
+        url: Page URL
+        include_footer: Also run the footer-specific extraction (homepage)
+
+    Returns:
+        Dictionary with emails, phones and social links
+    """
+    if not include_footer:
+        # Fast path: without the footer step nothing needs the DOM, so links
+        # are pulled from the raw bytes with a regex instead of a full parse
+        return _extract_from_page(url, _scan_hrefs(html), html)
+
+    tree = LexborHTMLParser(html)
+    info = _extract_from_page(url, _node_hrefs(tree.root), html)
+    footer_info = _extract_footer_contacts(tree, url)
+    info["emails"] = list(dict.fromkeys(info["emails"] + footer_info["emails"]))
+    info["phones"] = list(dict.fromkeys(info["phones"] + footer_info["phones"]))
+    info["social"].update(footer_info["social"])
+    return info
+
+
+
+def _to_utf8(body: bytes, charset: Optional[str]) -> bytes:
+    """
+    Re-encode a page declared in another charset as UTF-8.
+
+    UTF-8 and ASCII pages (nearly all of them) are returned untouched; no
+    charset sniffing is done, only the Content-Type header is trusted.
+    """
+    if not charset or charset.lower() in ("utf-8", "utf8", "ascii", "us-ascii"):
+        return body
+    try:
+        return body.decode(charset, errors="replace").encode("utf-8")
+    except LookupError:
+        # Unknown charset name: keep the raw bytes
+        return body
 
 
 class UserAgentRotator:
@@ -114,218 +399,193 @@ class UserAgentRotator:
 
 
 class RateLimiter:
-    """Enforces rate limiting between requests."""
+    """Enforces rate limiting between requests to the same host."""
 
     def __init__(self, min_delay: float, max_delay: float):
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self.last_request_time = 0
+        self.last_request_time: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def wait(self, host: str):
+        # Per-host lock: requests to one site are spaced out, while other
+        # sites keep going in the meantime
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            elapsed = time.time() - self.last_request_time.get(host, 0)
+            delay = random.uniform(self.min_delay, self.max_delay)
+            if elapsed < delay:
+                await asyncio.sleep(delay - elapsed)
+            self.last_request_time[host] = time.time()
+
+
+class PageCache:
+    """
+    Persistent HTTP cache for fetched pages (SQLite).
+
+    Pages younger than `expire_after` are served without a request; older
+    ones are revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged page costs a 304 instead of a full download on re-runs. Each
+    entry keeps the final URL the page was fetched from, so redirects are
+    reported the same way on cache hits.
+    """
 
-    def wait(self):
-        elapsed = time.time() - self.last_request_time
-        delay = random.uniform(self.min_delay, self.max_delay)
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
-        self.last_request_time = time.time()
+    def __init__(self, db_file: Path, expire_after: float):
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.expire_after = expire_after
+        self.conn = sqlite3.connect(str(db_file))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+            "body BLOB NOT NULL, fetched_at REAL NOT NULL, final_url TEXT)"
+        )
+        # Caches created before final_url was recorded
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(pages)")}
+        if "final_url" not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE pages ADD COLUMN final_url TEXT")
+
+    def get(self, url: str) -> Optional[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT etag, last_modified, body, fetched_at, final_url FROM pages WHERE url = ?",
+            (url,),
+        ).fetchone()
+
+    def is_fresh(self, entry: sqlite3.Row) -> bool:
+        return time.time() - entry["fetched_at"] < self.expire_after
+
+    def store(self, url: str, final_url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, body, fetched_at, final_url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, time.time(), final_url),
+            )
+
+    def touch(self, url: str, final_url: str):
+        """Mark a cached page as just revalidated (304 Not Modified)."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE pages SET fetched_at = ?, final_url = ? WHERE url = ?",
+                (time.time(), final_url, url),
+            )
+
+    def close(self):
+        self.conn.close()
 
 
 class ContactExtractor:
     """Extracts contact information from websites."""
 
-    def __init__(self, user_agent_rotator: UserAgentRotator, rate_limiter: RateLimiter):
+    def __init__(
+        self,
+        user_agent_rotator: UserAgentRotator,
+        rate_limiter: RateLimiter,
+        parse_pool: Optional[Executor] = None,
+        page_cache: Optional[PageCache] = None,
+    ):
         self.ua_rotator = user_agent_rotator
         self.rate_limiter = rate_limiter
-        self.session = requests.Session()
+        self.parse_pool = parse_pool
+        self.page_cache = page_cache
+        self.client: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self):
+        # HTTP/2 lets the homepage and contact pages of a site share one
+        # TLS connection instead of a handshake per request
+        self.client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+            timeout=REQUEST_TIMEOUT,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        self.client = None
+
+    async def _fetch_page(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Fetch page HTML content as raw bytes.
 
-    def _fetch_page(self, url: str) -> Optional[str]:
-        """Fetch page HTML content."""
-        self.rate_limiter.wait()
+        Returns:
+            Tuple of (final URL after redirects, body), or None. Pages served
+            from the cache report the final URL recorded when they were fetched.
+        """
+        cached = self.page_cache.get(url) if self.page_cache else None
+        if cached and self.page_cache.is_fresh(cached):
+            # Served from the cache: no request, so no rate-limit wait
+            return cached["final_url"] or url, cached["body"]
+
+        await self.rate_limiter.wait(urlparse(url).netloc)
 
         headers = {
             "User-Agent": self.ua_rotator.get_random(),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
         }
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
 
         for attempt in range(MAX_RETRIES):
             try:
-                response = self.session.get(
-                    url,
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                    allow_redirects=True,
-                )
-                if response.status_code == 200:
-                    return response.text
-                elif response.status_code == 404:
-                    return None
-                response.raise_for_status()
-
-            except requests.RequestException as e:
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == 304 and cached:
+                        final_url = str(response.url)
+                        self.page_cache.touch(url, final_url)
+                        return final_url, cached["body"]
+                    if response.status_code == 200:
+                        # Skip PDFs, images, feeds etc. before downloading them
+                        content_type = response.headers.get("Content-Type", "text/html")
+                        if "html" not in content_type.lower():
+                            logger.debug(f"Skipping non-HTML response from {url}: {content_type}")
+                            return None
+
+                        # Read at most MAX_PAGE_BYTES; contact details sit in
+                        # the first part of a page, not in a huge catalog dump
+                        chunks = []
+                        size = 0
+                        async for chunk in response.aiter_bytes(65536):
+                            chunks.append(chunk)
+                            size += len(chunk)
+                            if size >= MAX_PAGE_BYTES:
+                                logger.debug(f"Truncated {url} at {MAX_PAGE_BYTES} bytes")
+                                break
+                        html = _to_utf8(b"".join(chunks)[:MAX_PAGE_BYTES], response.charset_encoding)
+
+                        if self.page_cache and "no-store" not in response.headers.get("Cache-Control", ""):
+                            self.page_cache.store(
+                                url,
+                                str(response.url),
+                                html,
+                                response.headers.get("ETag"),
+                                response.headers.get("Last-Modified"),
+                            )
+                        return str(response.url), html
+                    elif response.status_code == 404:
+                        return None
+                    response.raise_for_status()
+
+            except httpx.HTTPError as e:
                 logger.debug(f"Request failed for {url}: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(2 * (attempt + 1))
+                    await asyncio.sleep(2 * (attempt + 1))
 
         return None
 
-    def _is_valid_email(self, email: str) -> bool:
-        """Check if email is valid and not excluded."""
-        email_lower = email.lower()
-
-        # Check against excluded patterns
-        for pattern in EXCLUDED_EMAIL_PATTERNS:
-            if pattern.lower() in email_lower:
-                return False
-
-        # Skip image file extensions that might match email pattern
-        if email_lower.endswith(('.png', '.jpg', '.jpeg', '.gif', '.svg')):
-            return False
-
-        # Skip obviously fake or placeholder emails
-        fake_indicators = ['example.com', 'test.com', 'email.com', 'youremail', 'your@']
-        for indicator in fake_indicators:
-            if indicator in email_lower:
-                return False
-
-        # Skip technical/tracking service emails (Sentry, analytics, etc.)
-        technical_domains = [
-            'ingest.sentry.io',
-            'sentry.io',
-            'segment.io',
-            'segment.com',
-            'mixpanel.com',
-            'amplitude.com',
-            'intercom.io',
-            'zendesk.com',
-            'freshdesk.com',
-            'klaviyo.com',
-            'mailchimp.com',
-            'sendgrid.net',
-            'postmarkapp.com',
-            'sparkpost.com',
-        ]
-        for domain in technical_domains:
-            if domain in email_lower:
-                return False
-
-        # Skip emails with long hexadecimal strings (likely DSNs or tokens)
-        # Extract the local part (before @)
-        local_part = email_lower.split('@')[0] if '@' in email_lower else ''
-        if len(local_part) > 20 and re.match(r'^[a-f0-9]+$', local_part):
-            return False
-
-        # Skip emails where domain contains numbers (often auto-generated)
-        domain_part = email_lower.split('@')[1] if '@' in email_lower else ''
-        # Allow common domains with numbers like o365.com but skip tracking pixels
-        if re.match(r'o\d+\.ingest\.', domain_part):
-            return False
-
-        return True
-
-    def _extract_emails_from_html(self, html: str) -> Set[str]:
-        """Extract valid email addresses from HTML content."""
-        emails = set()
-
-        # Find all email patterns
-        matches = EMAIL_PATTERN.findall(html)
-        for email in matches:
-            if self._is_valid_email(email):
-                emails.add(email.lower())
-
-        return emails
-
-    def _extract_mailto_links(self, soup: BeautifulSoup) -> Set[str]:
-        """Extract emails from mailto: links."""
-        emails = set()
-
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if href.startswith("mailto:"):
-                # Extract email from mailto link
-                email = href.replace("mailto:", "").split("?")[0].strip()
-                if email and self._is_valid_email(email):
-                    emails.add(email.lower())
-
-        return emails
-
-    def _extract_social_links(self, soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
-        """Extract social media profile links."""
-        social_links = {}
-
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-
-            for platform, pattern in SOCIAL_PATTERNS.items():
-                if platform in social_links:
-                    continue  # Already found this platform
-
-                match = pattern.search(href)
-                if match:
-                    username = match.group(1)
-                    # Skip generic pages
-                    if username.lower() not in ['share', 'sharer', 'intent', 'dialog']:
-                        social_links[platform] = href
-
-        return social_links
-
-    def _extract_phone_numbers(self, html: str, soup: BeautifulSoup) -> Set[str]:
-        """Extract phone numbers from page."""
-        phones = set()
-
-        # Look for tel: links
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if href.startswith("tel:"):
-                phone = href.replace("tel:", "").strip()
-                if phone:
-                    phones.add(phone)
-
-        # Look for common phone patterns in text
-        phone_pattern = re.compile(
-            r"(?:\+?1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}"
-        )
-        matches = phone_pattern.findall(html)
-        for phone in matches[:5]:  # Limit to avoid false positives
-            cleaned = re.sub(r"[^\d+]", "", phone)
-            if len(cleaned) >= 10:
-                phones.add(phone.strip())
-
-        return phones
-
-    def _extract_from_page(self, url: str, soup: BeautifulSoup, html: str) -> Dict:
-        """Extract all contact info from a single page."""
-        return {
-            "emails": list(self._extract_emails_from_html(html) | self._extract_mailto_links(soup)),
-            "social": self._extract_social_links(soup, url),
-            "phones": list(self._extract_phone_numbers(html, soup)),
-        }
-
-    def _extract_footer_contacts(self, soup: BeautifulSoup, html: str, url: str) -> Dict:
-        """Extract contact info specifically from footer section."""
-        footer_info = {
-            "emails": [],
-            "social": {},
-            "phones": [],
-        }
-
-        # Find footer element
-        footer = soup.find("footer")
-        if not footer:
-            # Try common footer class names
-            footer = soup.find(class_=re.compile(r"footer", re.IGNORECASE))
-
-        if footer:
-            footer_html = str(footer)
-            footer_soup = BeautifulSoup(footer_html, "html.parser")
+    async def _parse(self, html: bytes, url: str, include_footer: bool = False) -> Dict:
+        """Parse a page, in the parse pool when one is configured."""
+        if self.parse_pool is None:
+            return parse_page(html, url, include_footer)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_pool, parse_page, html, url, include_footer)
 
-            info = self._extract_from_page(url, footer_soup, footer_html)
-            footer_info["emails"] = info["emails"]
-            footer_info["social"] = info["social"]
-            footer_info["phones"] = info["phones"]
-
-        return footer_info
-
-    def extract(self, base_url: str) -> Dict:
+    async def extract(self, base_url: str) -> Dict:
         """
         Extract all contact information for a website.
 
@@ -348,66 +608,193 @@ class ContactExtractor:
             "error": None,
         }
 
-        all_emails = set()
-        all_phones = set()
+        # Dicts rather than sets: duplicates are dropped but discovery order
+        # (homepage, footer, contact page) is kept for the output
+        all_emails: Dict[str, None] = {}
+        all_phones: Dict[str, None] = {}
         all_social = {}
 
+        # Pages already fetched for this site (final URLs, after redirects),
+        # so a contact path that lands on one of them is not used again
+        seen_urls: Set[str] = set()
+
         try:
-            # 1. Check homepage
-            logger.info("  Checking homepage...")
-            homepage_html = self._fetch_page(base_url)
-            if homepage_html:
-                soup = BeautifulSoup(homepage_html, "html.parser")
-
-                # Extract from full page
-                page_info = self._extract_from_page(base_url, soup, homepage_html)
-                all_emails.update(page_info["emails"])
-                all_phones.update(page_info["phones"])
+            # 1. Check homepage (full page plus footer)
+            logger.info(f"  Checking homepage of {base_url}...")
+            homepage = await self._fetch_page(base_url)
+            if homepage:
+                final_url, homepage_html = homepage
+                seen_urls.add(base_url.rstrip("/"))
+                seen_urls.add(final_url.rstrip("/"))
+
+                page_info = await self._parse(homepage_html, base_url, include_footer=True)
+                all_emails.update(dict.fromkeys(page_info["emails"]))
+                all_phones.update(dict.fromkeys(page_info["phones"]))
                 all_social.update(page_info["social"])
 
-                # Extract specifically from footer
-                footer_info = self._extract_footer_contacts(soup, homepage_html, base_url)
-                all_emails.update(footer_info["emails"])
-                all_phones.update(footer_info["phones"])
-                all_social.update(footer_info["social"])
-
                 result["sources"].append("homepage")
 
-            # 2. Check contact pages
+            # 2. Check contact pages (one at a time: they share the site's
+            # rate limit, and the first page found ends the search)
             for contact_path in CONTACT_PAGES:
+                if len(all_emails) >= ENOUGH_EMAILS:
+                    logger.info(f"  {len(all_emails)} emails on the homepage, skipping contact pages")
+                    break
+
                 contact_url = urljoin(base_url, contact_path)
-                logger.info(f"  Checking {contact_path}...")
+                if contact_url.rstrip("/") in seen_urls:
+                    continue
+                logger.info(f"  Checking {contact_url}...")
+
+                contact_page = await self._fetch_page(contact_url)
+                if contact_page:
+                    final_url, contact_html = contact_page
+                    if final_url.rstrip("/") in seen_urls:
+                        # Redirected to a page already read (often the
+                        # homepage, for stores without this path)
+                        continue
+                    seen_urls.add(final_url.rstrip("/"))
 
-                contact_html = self._fetch_page(contact_url)
-                if contact_html:
                     result["contact_page_found"] = True
-                    soup = BeautifulSoup(contact_html, "html.parser")
 
-                    page_info = self._extract_from_page(contact_url, soup, contact_html)
-                    all_emails.update(page_info["emails"])
-                    all_phones.update(page_info["phones"])
+                    page_info = await self._parse(contact_html, contact_url)
+                    all_emails.update(dict.fromkeys(page_info["emails"]))
+                    all_phones.update(dict.fromkeys(page_info["phones"]))
                     all_social.update(page_info["social"])
 
                     result["sources"].append(contact_path)
                     break  # Found contact page, no need to check others
 
             # Compile results
-            result["emails"] = sorted(list(all_emails))
-            result["phones"] = sorted(list(all_phones))
+            result["emails"] = list(all_emails)
+            result["phones"] = list(all_phones)
             result["social"] = all_social
 
             # Log summary
-            logger.info(f"  Found: {len(result['emails'])} emails, "
+            logger.info(f"  {base_url}: {len(result['emails'])} emails, "
                        f"{len(result['phones'])} phones, "
                        f"{len(result['social'])} social profiles")
 
         except Exception as e:
             result["error"] = str(e)
-            logger.error(f"  Error extracting contacts: {e}")
+            logger.error(f"  Error extracting contacts from {base_url}: {e}")
 
         return result
 
 
+def append_checkpoint(f: BinaryIO, result: Dict) -> None:
+    """Append one site result to an open JSONL checkpoint and flush it."""
+    f.write(orjson.dumps(result) + b"\n")
+    f.flush()
+
+
+def iter_checkpoint(filepath: Path) -> Iterator[Dict]:
+    """Yield per-site results from a JSONL checkpoint, skipping truncated lines."""
+    with open(filepath, "rb") as f:
+        for line in f:
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping unreadable checkpoint line in {filepath}")
+
+
+def collapse_checkpoint(checkpoint_file: Path, output_file: Path) -> Dict:
+    """
+    Write the final contacts JSON (and its .meta.json sidecar) from a checkpoint.
+
+    The checkpoint is read twice (totals first, then records), so memory use
+    does not grow with the number of sites.
+
+    Args:
+        checkpoint_file: JSONL checkpoint holding every site result
+        output_file: JSON file to write ({"metadata": ..., "contacts": [...]})
+
+    Returns:
+        The metadata written to the output file
+    """
+    metadata = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "total_sites": 0,
+        "sites_with_contacts": 0,
+        "total_emails_found": 0,
+        "total_social_found": 0,
+    }
+    for result in iter_checkpoint(checkpoint_file):
+        metadata["total_sites"] += 1
+        if result["emails"] or result["social"]:
+            metadata["sites_with_contacts"] += 1
+        metadata["total_emails_found"] += len(result["emails"])
+        metadata["total_social_found"] += len(result["social"])
+
+    # Write to a temp file first so a crash never leaves a truncated output
+    tmp_file = output_file.with_suffix(".tmp")
+    with open(tmp_file, "wb") as out:
+        out.write(b'{\n  "metadata": ' + orjson.dumps(metadata) + b',\n  "contacts": [')
+        for idx, result in enumerate(iter_checkpoint(checkpoint_file)):
+            out.write((b",\n    " if idx else b"\n    ") + orjson.dumps(result))
+        out.write(b"\n  ]\n}\n")
+    os.replace(tmp_file, output_file)
+
+    # Metadata sidecar, for consumers that read the JSONL records directly
+    output_file.with_suffix(".meta.json").write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    return metadata
+
+
+async def extract_all(
+    extractor: ContactExtractor,
+    urls: List[str],
+    concurrency: int,
+    checkpoint_file: Path,
+) -> None:
+    """
+    Extract contacts for many sites concurrently, appending each result to the checkpoint.
+
+    A fixed set of worker coroutines drain a queue of URLs and hand their
+    results to a single writer, which appends them to the checkpoint in
+    completion order.
+
+    Args:
+        extractor: ContactExtractor instance
+        urls: Site URLs to process
+        concurrency: Number of worker coroutines (sites processed at once)
+        checkpoint_file: JSONL file each finished site is appended to
+    """
+    url_queue: asyncio.Queue = asyncio.Queue()
+    for url in urls:
+        url_queue.put_nowait(url)
+    result_queue: asyncio.Queue = asyncio.Queue()
+
+    total_urls = len(urls)
+
+    async def worker() -> None:
+        while True:
+            try:
+                url = url_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await result_queue.put(await extractor.extract(url))
+
+    async def writer() -> None:
+        finished = 0
+        with open(checkpoint_file, "ab") as checkpoint:
+            while True:
+                result = await result_queue.get()
+                if result is None:
+                    return
+                append_checkpoint(checkpoint, result)
+                # Emit progress for pipeline
+                finished += 1
+                emit_progress(finished, total_urls, f"Extracted contacts from {result['url']}")
+
+    async with extractor:
+        writer_task = asyncio.create_task(writer())
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        finally:
+            await result_queue.put(None)
+            await writer_task
+
+
 def load_shopify_sites() -> List[str]:
     """Load verified Shopify site URLs."""
     urls = []
@@ -417,15 +804,15 @@ def load_shopify_sites() -> List[str]:
         return urls
 
     try:
-        with open(SHOPIFY_SITES_FILE, "r") as f:
-            data = json.load(f)
+        with open(SHOPIFY_SITES_FILE, "rb") as f:
+            data = orjson.loads(f.read())
 
         for site in data.get("shopify_sites", []):
             urls.append(site["url"])
 
         logger.info(f"Loaded {len(urls)} verified Shopify sites")
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse Shopify sites file: {e}")
 
     return urls
@@ -441,8 +828,41 @@ def main():
         type=str,
         help="Single URL to extract contacts from",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Number of sites processed in parallel (default: 16)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the page cache and download every page again",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run, skipping sites already in its checkpoint",
+    )
+    parser.add_argument(
+        "--merge-to-json",
+        action="store_true",
+        help="Only rebuild contacts.json from contacts.jsonl (no fetching)",
+    )
     args = parser.parse_args()
 
+    # Results are streamed to a JSONL file, one site per line, as they are
+    # extracted; contacts.json is built from it at the end
+    checkpoint_file = CONTACTS_FILE.with_suffix(".jsonl")
+
+    if args.merge_to_json:
+        if not checkpoint_file.exists():
+            logger.error(f"No results to merge: {checkpoint_file} not found")
+            sys.exit(1)
+        metadata = collapse_checkpoint(checkpoint_file, CONTACTS_FILE)
+        logger.info(f"Merged {metadata['total_sites']} sites into {CONTACTS_FILE}")
+        return
+
     # Determine URLs to process
     if args.url:
         urls = [args.url]
@@ -456,42 +876,41 @@ def main():
     # Initialize components
     ua_rotator = UserAgentRotator(USER_AGENTS_FILE)
     rate_limiter = RateLimiter(MIN_REQUEST_DELAY, MAX_REQUEST_DELAY)
-    extractor = ContactExtractor(ua_rotator, rate_limiter)
-
-    # Extract contacts for each URL
-    results = []
-    sites_with_contacts = 0
-    total_urls = len(urls)
-
-    for i, url in enumerate(urls, 1):
-        # Emit progress for pipeline
-        emit_progress(i, total_urls, f"Extracting contacts from {url}")
-
-        logger.info(f"[{i}/{total_urls}] Processing {url}")
-        result = extractor.extract(url)
-        results.append(result)
-
-        if result["emails"] or result["social"]:
-            sites_with_contacts += 1
-
-    # Prepare output
-    output = {
-        "metadata": {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "total_sites": len(results),
-            "sites_with_contacts": sites_with_contacts,
-            "total_emails_found": sum(len(r["emails"]) for r in results),
-            "total_social_found": sum(len(r["social"]) for r in results),
-        },
-        "contacts": results,
-    }
+    # HTML parsing is CPU-bound, so it runs in worker processes: one per
+    # core, but never more than there are sites in flight. Workers start
+    # lazily from inside the event loop, after resolver and HTTP threads
+    # exist, so they come from a forkserver (or spawn) rather than fork
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    parse_pool = ProcessPoolExecutor(
+        max_workers=max(1, min(os.cpu_count() or 1, args.concurrency, len(urls))),
+        mp_context=multiprocessing.get_context(start_method),
+    )
+    page_cache = None if args.no_cache else PageCache(CONTACTS_HTTP_CACHE_FILE, HTTP_CACHE_EXPIRE)
+    extractor = ContactExtractor(ua_rotator, rate_limiter, parse_pool, page_cache)
 
-    # Ensure output directory exists
+    # Each finished site is appended to the JSONL file as soon as it is done
+    # and the final JSON is built from it, so results are never held in
+    # memory and an interrupted run can be picked up again with --resume
     CONTACTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if checkpoint_file.exists():
+        if args.resume:
+            done_urls = {result["url"] for result in iter_checkpoint(checkpoint_file)}
+            urls = [url for url in urls if url not in done_urls]
+            logger.info(f"Recovered {len(done_urls)} sites from checkpoint {checkpoint_file}")
+        else:
+            checkpoint_file.unlink()
+
+    # Extract contacts for all URLs concurrently
+    try:
+        asyncio.run(extract_all(extractor, urls, args.concurrency, checkpoint_file))
+    finally:
+        parse_pool.shutdown()
+        if page_cache:
+            page_cache.close()
 
-    # Write output
-    with open(CONTACTS_FILE, "w") as f:
-        json.dump(output, f, indent=2)
+    # Write output from the checkpoint
+    checkpoint_file.touch()
+    metadata = collapse_checkpoint(checkpoint_file, CONTACTS_FILE)
 
     logger.info(f"Contact extraction complete. Results saved to {CONTACTS_FILE}")
 
@@ -499,14 +918,14 @@ def main():
     print("\n" + "=" * 60)
     print("CONTACT EXTRACTION SUMMARY")
     print("=" * 60)
-    print(f"  Sites processed: {len(results)}")
-    print(f"  Sites with contacts: {sites_with_contacts}")
-    print(f"  Total emails found: {output['metadata']['total_emails_found']}")
-    print(f"  Total social profiles: {output['metadata']['total_social_found']}")
+    print(f"  Sites processed: {metadata['total_sites']}")
+    print(f"  Sites with contacts: {metadata['sites_with_contacts']}")
+    print(f"  Total emails found: {metadata['total_emails_found']}")
+    print(f"  Total social profiles: {metadata['total_social_found']}")
     print("=" * 60)
 
     # Print individual results
-    for result in results:
+    for result in iter_checkpoint(checkpoint_file):
         url = result.get("url", "Unknown")
         emails = result.get("emails", [])
         social = result.get("social", {})
@@ -18,15 +18,21 @@ Usage:
 """
 
 import sys
-import json
 import logging
+import mmap
+import os
 import argparse
+import functools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Formatter
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
 from urllib.parse import urlparse
 
+import orjson
+
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -61,7 +67,11 @@ def emit_progress(current: int, total: int, message: str = "") -> None:
             "total": total,
             "message": message or f"Processing {current}/{total}",
         }
-        print(json.dumps(progress_data), flush=True)
+        # The executor streams these lines to the UI live, so each one is
+        # flushed; text printed earlier is flushed first to keep line order
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(progress_data) + b"\n")
+        sys.stdout.buffer.flush()
 
 
 # Email templates based on issue categories (design-focused)
@@ -186,6 +196,101 @@ Best regards,
     }
 }
 
+# Placeholders the email templates may use
+TEMPLATE_FIELDS = {"store_name", "evidence", "sender_name", "sender_title"}
+
+
+def _compile_templates(templates: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, Callable[..., str]]]:
+    """
+    Resolve each template's format method once and check its placeholders.
+
+    A misspelled placeholder raises at import instead of on the first draft
+    that happens to use that category.
+    """
+    compiled = {}
+    for category, template in templates.items():
+        for part, text in template.items():
+            for _, field, _, _ in Formatter().parse(text):
+                if field is not None and field not in TEMPLATE_FIELDS:
+                    raise ValueError(f"Unknown placeholder {{{field}}} in {category} {part} template")
+        compiled[category] = {part: text.format for part, text in template.items()}
+    return compiled
+
+
+@functools.lru_cache(maxsize=None)
+def _templates_for_sender(sender_name: str, sender_title: str) -> Dict[str, Dict[str, Callable[..., str]]]:
+    """
+    Compile the email templates with the signature already filled in.
+
+    The sender is fixed for a whole run, so only {store_name} and {evidence}
+    are left to substitute for each draft.
+    """
+    def bake(text: str) -> str:
+        for field, value in (("sender_name", sender_name), ("sender_title", sender_title)):
+            # Braces in the value must survive the later format() call
+            text = text.replace("{" + field + "}", value.replace("{", "{{").replace("}", "}}"))
+        return text
+
+    return _compile_templates({
+        category: {part: bake(text) for part, text in template.items()}
+        for category, template in EMAIL_TEMPLATES.items()
+    })
+
+
+# Check the templates at import and prepare them for the default sender
+_templates_for_sender(SENDER_NAME, SENDER_TITLE)
+
+
+# Issue prioritisation for outreach: by severity, then by category (design-focused)
+SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+CATEGORY_ORDER = {
+    "images": 0,       # Most visible/actionable
+    "layout": 1,       # Clear visual issues
+    "mobile": 2,       # Important for conversions
+    "hierarchy": 3,    # Design clarity
+    "contrast": 4,     # Readability issues
+    "typography": 5,   # Text issues
+}
+
+# Characters replaced with "_" in draft file names
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\-]")
+
+# Layout of each saved draft file
+DRAFT_TEMPLATE = """================================================================================
+OUTREACH DRAFT
+================================================================================
+
+Store: {url}
+Generated: {generated_at}
+
+--------------------------------------------------------------------------------
+TO: {to}
+--------------------------------------------------------------------------------
+
+SUBJECT: {subject}
+
+--------------------------------------------------------------------------------
+BODY:
+--------------------------------------------------------------------------------
+
+{body}
+
+--------------------------------------------------------------------------------
+ISSUE REFERENCED:
+--------------------------------------------------------------------------------
+Category: {category}
+Severity: {severity}
+Title: {title}
+
+--------------------------------------------------------------------------------
+CONTACT INFO:
+--------------------------------------------------------------------------------
+Emails: {emails}
+Social: {social}
+
+================================================================================
+"""
+
 
 def get_store_name(url: str) -> str:
     """Extract a readable store name from URL."""
@@ -216,29 +321,21 @@ def format_evidence(issue: Dict) -> str:
         return "I noticed an issue that could be affecting your conversions."
 
 
+def _issue_priority(issue: Dict) -> Tuple[int, int]:
+    """Sort key for issues: severity first, then category."""
+    severity = SEVERITY_ORDER.get(issue.get("severity", "medium"), 1)
+    category = CATEGORY_ORDER.get(issue.get("category", "generic"), 6)
+    return (severity, category)
+
+
 def select_best_issue(issues: List[Dict]) -> Optional[Dict]:
     """Select the best issue to highlight in outreach."""
     if not issues:
         return None
 
-    # Prioritize by severity, then by category (design-focused)
-    severity_order = {"high": 0, "medium": 1, "low": 2}
-    category_order = {
-        "images": 0,       # Most visible/actionable
-        "layout": 1,       # Clear visual issues
-        "mobile": 2,       # Important for conversions
-        "hierarchy": 3,    # Design clarity
-        "contrast": 4,     # Readability issues
-        "typography": 5,   # Text issues
-    }
-
-    def sort_key(issue):
-        severity = severity_order.get(issue.get("severity", "medium"), 1)
-        category = category_order.get(issue.get("category", "generic"), 6)
-        return (severity, category)
-
-    sorted_issues = sorted(issues, key=sort_key)
-    return sorted_issues[0]
+    # Only the top issue is needed, so a linear min() replaces a full sort;
+    # like sorted(), it keeps the first of equally ranked issues
+    return min(issues, key=_issue_priority)
 
 
 def generate_email(
@@ -266,16 +363,12 @@ def generate_email(
     evidence = format_evidence(issue)
 
     # Get appropriate template
-    template = EMAIL_TEMPLATES.get(category, EMAIL_TEMPLATES["generic"])
+    templates = _templates_for_sender(sender_name, sender_title)
+    template = templates.get(category, templates["generic"])
 
     # Format email
-    subject = template["subject"].format(store_name=store_name)
-    body = template["body"].format(
-        store_name=store_name,
-        evidence=evidence,
-        sender_name=sender_name,
-        sender_title=sender_title,
-    )
+    subject = template["subject"](store_name=store_name)
+    body = template["body"](store_name=store_name, evidence=evidence)
 
     # Truncate if too long
     if len(body) > MAX_EMAIL_LENGTH:
@@ -294,14 +387,30 @@ def generate_email(
     }
 
 
+@functools.lru_cache(maxsize=100_000)
 def generate_safe_filename(url: str) -> str:
     """Generate safe filename from URL."""
     parsed = urlparse(url)
     domain = parsed.netloc.replace("www.", "")
-    safe = re.sub(r"[^\w\-]", "_", domain)
+    safe = UNSAFE_FILENAME_CHARS.sub("_", domain)
     return safe
 
 
+def read_json_file(path: Path):
+    """
+    Parse a JSON file from a read-only memory map.
+
+    orjson reads the mapped pages directly, so the file contents are never
+    copied into a Python bytes object first.
+    """
+    with open(path, "rb") as f:
+        # mmap refuses empty files; let orjson report them as invalid JSON
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
 def load_audit_results() -> Dict:
     """Load audit results with analysis."""
     if not AUDIT_RESULTS_FILE.exists():
@@ -309,9 +418,8 @@ def load_audit_results() -> Dict:
         return {}
 
     try:
-        with open(AUDIT_RESULTS_FILE, "r") as f:
-            return json.load(f)
-    except json.JSONDecodeError as e:
+        return read_json_file(AUDIT_RESULTS_FILE)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse audit results: {e}")
         return {}
 
@@ -325,15 +433,14 @@ def load_contacts() -> Dict:
         return contacts_by_url
 
     try:
-        with open(CONTACTS_FILE, "r") as f:
-            data = json.load(f)
-
-        for contact in data.get("contacts", []):
-            url = contact.get("url")
-            if url:
-                contacts_by_url[url] = contact
+        data = read_json_file(CONTACTS_FILE)
+        contacts_by_url = {
+            contact["url"]: contact
+            for contact in data.get("contacts", ())
+            if contact.get("url")
+        }
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse contacts file: {e}")
 
     return contacts_by_url
@@ -384,6 +491,10 @@ def main():
         "drafts": [],
     }
 
+    # Draft files to write, keyed by path so a later draft for the same
+    # store replaces an earlier one, as sequential writes did
+    pending_drafts: Dict[Path, bytes] = {}
+
     audits = audit_data.get("audits", [])
     total_audits = len(audits)
 
@@ -436,45 +547,22 @@ def main():
         filename = generate_safe_filename(url)
         draft_path = DRAFTS_DIR / f"{filename}.txt"
 
-        draft_content = f"""================================================================================
-OUTREACH DRAFT
-================================================================================
-
-Store: {url}
-Generated: {datetime.now(timezone.utc).isoformat()}
-
---------------------------------------------------------------------------------
-TO: {', '.join(email['to_emails']) if email['to_emails'] else 'No email found - check social media'}
---------------------------------------------------------------------------------
-
-SUBJECT: {email['subject']}
-
---------------------------------------------------------------------------------
-BODY:
---------------------------------------------------------------------------------
-
-{email['body']}
-
---------------------------------------------------------------------------------
-ISSUE REFERENCED:
---------------------------------------------------------------------------------
-Category: {email['issue_referenced']['category']}
-Severity: {email['issue_referenced']['severity']}
-Title: {email['issue_referenced']['title']}
-
---------------------------------------------------------------------------------
-CONTACT INFO:
---------------------------------------------------------------------------------
-Emails: {', '.join(contact_info.get('emails', [])) or 'None found'}
-Social: {', '.join(f"{k}: {v}" for k, v in contact_info.get('social', {}).items()) or 'None found'}
-
-================================================================================
-"""
+        draft_content = DRAFT_TEMPLATE.format(
+            url=url,
+            generated_at=datetime.now(timezone.utc).isoformat(),
+            to=", ".join(email["to_emails"]) if email["to_emails"] else "No email found - check social media",
+            subject=email["subject"],
+            body=email["body"],
+            category=email["issue_referenced"]["category"],
+            severity=email["issue_referenced"]["severity"],
+            title=email["issue_referenced"]["title"],
+            emails=", ".join(contact_info.get("emails", [])) or "None found",
+            social=", ".join(f"{k}: {v}" for k, v in contact_info.get("social", {}).items()) or "None found",
+        )
 
-        with open(draft_path, "w") as f:
-            f.write(draft_content)
+        pending_drafts[draft_path] = draft_content.encode("utf-8")
 
-        logger.info(f"  Draft saved: {draft_path}")
+        logger.info(f"  Draft ready: {draft_path}")
         drafts_generated += 1
 
         # Add to summary
@@ -486,10 +574,16 @@ Social: {', '.join(f"{k}: {v}" for k, v in contact_info.get('social', {}).items(
             "issue_category": email["issue_referenced"]["category"],
         })
 
+    # Write draft files; they are independent, so a small thread pool
+    # overlaps the disk I/O. list() surfaces any write error here
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(Path.write_bytes, pending_drafts.keys(), pending_drafts.values()))
+    logger.info(f"Saved {len(pending_drafts)} draft files to {DRAFTS_DIR}")
+
     # Save summary JSON
     summary_path = DRAFTS_DIR / "drafts_summary.json"
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    with open(summary_path, "wb") as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
     # Print summary
     print("\n" + "=" * 60)
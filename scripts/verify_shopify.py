@@ -9,26 +9,36 @@ Features:
 - Checks multiple Shopify indicators (CDN, scripts, headers, etc.)
 - Calculates confidence score based on weighted signals
 - Uses rotating user agents
-- Applies strict rate limiting
+- Applies strict per-host rate limiting
+- Verifies several sites in parallel with a thread pool
 - Discards non-Shopify sites automatically
 
 Usage:
-    python scripts/verify_shopify.py [--min-confidence 60]
+    python scripts/verify_shopify.py [--min-confidence 60] [--workers 16]
 """
 
 import sys
-import json
 import time
 import random
 import logging
+import mmap
+import os
 import argparse
+import functools
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import takewhile
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import Retry
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -42,8 +52,10 @@ from config.settings import (
     MAX_REQUEST_DELAY,
     REQUEST_TIMEOUT,
     MAX_RETRIES,
+    MAX_RETRY_AFTER,
     MIN_SHOPIFY_CONFIDENCE,
     SHOPIFY_SIGNALS,
+    VERIFY_MAX_PAGE_BYTES,
     LOG_LEVEL,
     LOG_FORMAT,
 )
@@ -52,6 +64,106 @@ from config.settings import (
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# One case-insensitive pass over the raw page bytes finds every HTML signal
+# (all of them are ASCII, so no decode is needed). The tag checks use
+# lookaheads so a <script src=".../cdn.shopify.com/..."> still leaves the
+# CDN reference to be matched on its own.
+SHOPIFY_HTML_PATTERN = re.compile(
+    rb"(?P<cdn>cdn\.shopify\.com)"
+    rb"|(?P<myshopify>myshopify\.com)"
+    rb"|(?P<theme>shopify\.theme|window\.shopify)"
+    rb"|(?P<section>shopify-section)"
+    rb"|(?P<pay>shopify_pay|shopify-payment)"
+    rb"|(?P<cart>cart\.js)"
+    rb"|(?P<token>accesstoken)"
+    rb"|(?P<meta><meta\b(?=[^>]*shopify))"
+    rb"|(?P<script><script\b(?=[^>]*\ssrc\s*=\s*[\"']?[^\"'\s>]*shopify))"
+    rb"|(?P<data>\sdata-shopify(?=[\s=/>]))"
+    rb"|(?P<shopify>shopify)",
+    re.IGNORECASE,
+)
+
+# Pattern group -> signal name, in the order signals are reported
+HTML_SIGNAL_GROUPS = {
+    "cdn": "cdn.shopify.com",
+    "myshopify": "myshopify.com",
+    "theme": "Shopify.theme",
+    "section": "shopify-section",
+    "pay": "shopify_pay",
+    "cart": "/cart.js",
+}
+HTML_EXTRA_GROUPS = {
+    "meta": "shopify_meta",
+    "script": "shopify_scripts",
+    "data": "data-shopify",
+}
+
+# Confidence weight of each pattern group, looked up in SHOPIFY_SIGNALS once
+# rather than per chunk while a page is being read
+HTML_GROUP_WEIGHTS = {
+    group: SHOPIFY_SIGNALS[signal]
+    for group, signal in HTML_SIGNAL_GROUPS.items()
+    if signal in SHOPIFY_SIGNALS
+}
+ACCESS_TOKEN_WEIGHT = SHOPIFY_SIGNALS.get("shopify.accessToken", 0)
+
+# Streamed page bodies are read in chunks of this size
+CHUNK_SIZE = 16384
+
+# Bytes carried over between chunks so signals split across a chunk
+# boundary are still seen
+CHUNK_OVERLAP = 256
+
+
+def _scan_html(html: bytes, enough: Optional[int] = None, groups: Optional[Set[str]] = None) -> Set[str]:
+    """
+    Collect the names of the SHOPIFY_HTML_PATTERN groups present in html.
+
+    Args:
+        html: Page bytes to scan
+        enough: Stop scanning once the groups found score at least this much
+        groups: Groups found earlier, extended in place
+
+    Returns:
+        The set of matched group names
+    """
+    if groups is None:
+        groups = set()
+    if enough is not None and _html_score(groups) >= enough:
+        return groups
+
+    for match in SHOPIFY_HTML_PATTERN.finditer(html):
+        group = match.lastgroup
+        if group not in groups:
+            groups.add(group)
+            # Score only changes when a new group turns up
+            if enough is not None and _html_score(groups) >= enough:
+                break
+    return groups
+
+
+def _html_score(groups: Set[str]) -> int:
+    """Confidence contributed by the matched pattern groups (same rules as _html_signals)."""
+    score = sum(HTML_GROUP_WEIGHTS.get(group, 0) for group in groups)
+    if "token" in groups and groups - {"cart", "token"}:
+        score += ACCESS_TOKEN_WEIGHT
+    return score
+
+
+def _html_signals(groups: Set[str]) -> Dict[str, bool]:
+    """Build the signal -> found mapping from the matched pattern groups."""
+    signals_found = {signal: group in groups for group, signal in HTML_SIGNAL_GROUPS.items()}
+
+    # Access token references only count on a page that mentions Shopify;
+    # every group other than cart/token implies the word is present
+    signals_found["shopify.accessToken"] = "token" in groups and bool(groups - {"cart", "token"})
+
+    for group, signal in HTML_EXTRA_GROUPS.items():
+        if group in groups:
+            signals_found[signal] = True
+
+    return signals_found
+
 
 def emit_progress(current: int, total: int, message: str = "") -> None:
     """
@@ -67,7 +179,11 @@ def emit_progress(current: int, total: int, message: str = "") -> None:
             "total": total,
             "message": message or f"Processing {current}/{total}",
         }
-        print(json.dumps(progress_data), flush=True)
+        # The executor streams these lines to the UI live, so each one is
+        # flushed; text printed earlier is flushed first to keep line order
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(progress_data) + b"\n")
+        sys.stdout.buffer.flush()
 
 
 class UserAgentRotator:
@@ -80,6 +196,19 @@ class UserAgentRotator:
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                 "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             ]
+        # Full request headers per user agent, built once; requests merges
+        # them into a new dict per request, so they are never mutated
+        self._headers = tuple(
+            {
+                "User-Agent": ua,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+                "Accept-Encoding": "gzip, deflate",
+                "DNT": "1",
+                "Connection": "keep-alive",
+            }
+            for ua in self.user_agents
+        )
 
     def _load_user_agents(self, filepath: Path) -> List[str]:
         agents = []
@@ -96,23 +225,52 @@ class UserAgentRotator:
     def get_random(self) -> str:
         return random.choice(self.user_agents)
 
+    def get_random_headers(self) -> Dict[str, str]:
+        return random.choice(self._headers)
+
 
 class RateLimiter:
-    """Enforces rate limiting between requests."""
+    """Enforces rate limiting between requests to the same host (thread-safe)."""
 
     def __init__(self, min_delay: float, max_delay: float):
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self.last_request_time = 0
+        self.last_request_time: Dict[str, float] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def wait(self, host: str):
+        # Per-host lock: requests to one site are spaced out, while worker
+        # threads on other sites keep going in the meantime
+        with self._locks_guard:
+            lock = self._locks.setdefault(host, threading.Lock())
+        with lock:
+            elapsed = time.time() - self.last_request_time.get(host, 0)
+            delay = random.uniform(self.min_delay, self.max_delay)
+            if elapsed < delay:
+                sleep_time = delay - elapsed
+                logger.debug(f"Rate limiting {host}: sleeping {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+            self.last_request_time[host] = time.time()
+
+
+class PoliteRetry(Retry):
+    """
+    urllib3 Retry that always waits before retrying.
+
+    Stock urllib3 retries the first failure immediately; here the backoff
+    grows linearly from the first retry (backoff_factor, 2x, ...), and a
+    server's Retry-After is honoured up to MAX_RETRY_AFTER seconds.
+    """
 
-    def wait(self):
-        elapsed = time.time() - self.last_request_time
-        delay = random.uniform(self.min_delay, self.max_delay)
-        if elapsed < delay:
-            sleep_time = delay - elapsed
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+    def get_backoff_time(self) -> float:
+        # Consecutive errors so far, ignoring redirects
+        errors = len(list(takewhile(lambda entry: entry.redirect_location is None, reversed(self.history))))
+        return float(min(self.backoff_max, self.backoff_factor * errors))
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
 
 
 class ShopifyVerifier:
@@ -121,138 +279,145 @@ class ShopifyVerifier:
     def __init__(self, user_agent_rotator: UserAgentRotator, rate_limiter: RateLimiter):
         self.ua_rotator = user_agent_rotator
         self.rate_limiter = rate_limiter
-        self.session = requests.Session()
-
-    def _fetch_page(self, url: str) -> Tuple[Optional[str], Optional[Dict]]:
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """Session of the calling thread, so each worker keeps its own connection pool."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            # Retries run inside urllib3 and reuse the pooled connection;
+            # they wait 3s, 6s, ... or the server's (capped) Retry-After
+            adapter = HTTPAdapter(max_retries=PoliteRetry(
+                total=max(MAX_RETRIES - 1, 0),
+                backoff_factor=3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        return session
+
+    def _fetch_page(self, url: str) -> Tuple[Optional[bytes], Optional[CaseInsensitiveDict], bool]:
         """
         Fetch page HTML and headers.
 
+        The body is streamed and the download stops early once the headers
+        and the HTML read so far already clear MIN_SHOPIFY_CONFIDENCE.
+        Otherwise the whole page is read, up to the VERIFY_MAX_PAGE_BYTES
+        safety limit.
+
         Args:
             url: URL to fetch
 
         Returns:
-            Tuple of (html_content, headers_dict) or (None, None) on failure
+            Tuple of (html_bytes, response_headers, truncated), where truncated
+            means the safety limit cut the page off before a verdict, or
+            (None, None, False) on failure
         """
-        self.rate_limiter.wait()
-
-        headers = {
-            "User-Agent": self.ua_rotator.get_random(),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-            "DNT": "1",
-            "Connection": "keep-alive",
-        }
+        self.rate_limiter.wait(urlparse(url).netloc)
+
+        headers = self.ua_rotator.get_random_headers()
 
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = self.session.get(
-                    url,
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                    allow_redirects=True,
-                )
+        try:
+            with self.session.get(
+                url,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
+                allow_redirects=True,
+                stream=True,
+            ) as response:
                 response.raise_for_status()
-                return response.text, dict(response.headers)
+                html, truncated = self._read_html(response, self._check_header_signals(response.headers))
+                return html, response.headers, truncated
 
-            except requests.RequestException as e:
-                logger.warning(f"Request failed for {url} (attempt {attempt + 1}): {e}")
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(3 * (attempt + 1))
+        except requests.RequestException as e:
+            logger.warning(f"Request failed for {url}: {e}")
 
-        return None, None
+        return None, None, False
 
-    def _check_html_signals(self, html: str) -> Dict[str, bool]:
+    def _read_html(self, response: requests.Response, header_signals: Dict[str, bool]) -> Tuple[bytes, bool]:
         """
-        Check HTML content for Shopify signals.
+        Read a streamed response body until the verdict is certain.
+
+        Reading stops early only once the threshold is reached; a page that
+        has not reached it is read to the end (or VERIFY_MAX_PAGE_BYTES), so
+        a negative verdict always covers the whole page.
 
         Args:
-            html: HTML content of the page
+            response: Response opened with stream=True
+            header_signals: Signals already found in the response headers
 
         Returns:
-            Dictionary of signal -> found mapping
+            Tuple of (raw HTML read, truncated). The HTML is a prefix of the
+            page when the threshold was reached early, or empty when the
+            headers alone clear it; truncated is True when the safety limit
+            cut the page off without a verdict
         """
-        signals_found = {}
-        html_lower = html.lower()
-
-        # Check for CDN references
-        signals_found["cdn.shopify.com"] = "cdn.shopify.com" in html_lower
-
-        # Check for myshopify.com references
-        signals_found["myshopify.com"] = "myshopify.com" in html_lower
-
-        # Check for Shopify.theme JavaScript object
-        signals_found["Shopify.theme"] = "shopify.theme" in html_lower or "window.shopify" in html_lower
-
-        # Check for shopify-section elements
-        signals_found["shopify-section"] = "shopify-section" in html_lower
-
-        # Check for Shopify Pay
-        signals_found["shopify_pay"] = "shopify_pay" in html_lower or "shopify-payment" in html_lower
-
-        # Check for cart.js endpoint
-        signals_found["/cart.js"] = "/cart.js" in html_lower or "cart.js" in html_lower
-
-        # Check for Shopify access token references
-        signals_found["shopify.accessToken"] = "accesstoken" in html_lower and "shopify" in html_lower
-
-        # Additional checks via BeautifulSoup
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Check for Shopify meta tags
-            for meta in soup.find_all("meta"):
-                content = str(meta.get("content", "")).lower()
-                name = str(meta.get("name", "")).lower()
-                if "shopify" in content or "shopify" in name:
-                    signals_found["shopify_meta"] = True
-                    break
-
-            # Check for Shopify scripts
-            for script in soup.find_all("script", src=True):
-                src = script.get("src", "").lower()
-                if "shopify" in src or "cdn.shopify" in src:
-                    signals_found["shopify_scripts"] = True
-                    break
-
-            # Check for Shopify-specific data attributes
-            shopify_attrs = soup.find_all(attrs={"data-shopify": True})
-            if shopify_attrs:
-                signals_found["data-shopify"] = True
+        chunks = response.iter_content(CHUNK_SIZE)
+        groups: Set[str] = set()
+        parts = []
+        tail = b""
+        size = 0
+        header_score = self._calculate_confidence({}, header_signals)
+
+        enough = MIN_SHOPIFY_CONFIDENCE - header_score
+
+        while _html_score(groups) < enough:
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            size += len(chunk)
+            parts.append(chunk)
+            _scan_html(tail + chunk, enough, groups)
+            tail = chunk[-CHUNK_OVERLAP:]
+            if size >= VERIFY_MAX_PAGE_BYTES and _html_score(groups) < enough:
+                logger.warning(f"Stopped reading {response.url} at {size} bytes without a verdict")
+                return b"".join(parts), True
+        else:
+            logger.debug(f"Enough Shopify signals in first {size} bytes of {response.url}")
+
+        return b"".join(parts), False
+
+    def _check_html_signals(self, html: bytes, enough: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Check HTML content for Shopify signals.
 
-        except Exception as e:
-            logger.debug(f"BeautifulSoup parsing error: {e}")
+        Args:
+            html: Raw HTML bytes of the page
+            enough: Stop scanning once the signals found score at least this
+                much (the rest of the page cannot change the verdict)
 
-        return signals_found
+        Returns:
+            Dictionary of signal -> found mapping
+        """
+        return _html_signals(_scan_html(html, enough))
 
-    def _check_header_signals(self, headers: Dict) -> Dict[str, bool]:
+    def _check_header_signals(self, headers: CaseInsensitiveDict) -> Dict[str, bool]:
         """
         Check HTTP headers for Shopify signals.
 
         Args:
-            headers: Response headers dictionary
+            headers: Response headers (case-insensitive keys)
 
         Returns:
             Dictionary of signal -> found mapping
         """
         signals_found = {}
 
-        # Normalize header names to lowercase
-        headers_lower = {k.lower(): v for k, v in headers.items()}
-
         # Check for X-ShopId header
-        signals_found["X-ShopId"] = "x-shopid" in headers_lower
+        signals_found["X-ShopId"] = "x-shopid" in headers
 
         # Check for X-Shopify-Stage header
-        signals_found["X-Shopify-Stage"] = "x-shopify-stage" in headers_lower
+        signals_found["X-Shopify-Stage"] = "x-shopify-stage" in headers
 
         # Check server header for Shopify
-        server = headers_lower.get("server", "").lower()
+        server = headers.get("server", "").lower()
         if "shopify" in server:
             signals_found["server_shopify"] = True
 
         # Check for Shopify cookies
-        cookies = headers_lower.get("set-cookie", "").lower()
+        cookies = headers.get("set-cookie", "").lower()
         if "shopify" in cookies or "_shopify" in cookies:
             signals_found["shopify_cookies"] = True
 
@@ -269,17 +434,13 @@ class ShopifyVerifier:
         Returns:
             Confidence score (0-100)
         """
-        total_score = 0
-
-        # Score HTML signals
-        for signal, found in html_signals.items():
-            if found and signal in SHOPIFY_SIGNALS:
-                total_score += SHOPIFY_SIGNALS[signal]
-
-        # Score header signals
-        for signal, found in header_signals.items():
-            if found and signal in SHOPIFY_SIGNALS:
-                total_score += SHOPIFY_SIGNALS[signal]
+        # One summing pass over both signal sets; unweighted signals add 0
+        total_score = sum(
+            SHOPIFY_SIGNALS.get(signal, 0)
+            for signals in (html_signals, header_signals)
+            for signal, found in signals.items()
+            if found
+        )
 
         # Cap at 100
         return min(total_score, 100)
@@ -306,15 +467,17 @@ class ShopifyVerifier:
         }
 
         # Fetch page
-        html, headers = self._fetch_page(url)
+        html, headers, truncated = self._fetch_page(url)
 
-        if not html:
+        if html is None:
             result["error"] = "Failed to fetch page"
             return result
 
-        # Check signals
-        html_signals = self._check_html_signals(html)
-        header_signals = self._check_header_signals(headers or {})
+        # Check signals; the HTML scan ends once it has what the headers lack
+        header_signals = self._check_header_signals(headers or CaseInsensitiveDict())
+        html_signals = self._check_html_signals(
+            html, MIN_SHOPIFY_CONFIDENCE - self._calculate_confidence({}, header_signals)
+        )
 
         # Combine signals
         all_signals = {**html_signals, **header_signals}
@@ -327,6 +490,11 @@ class ShopifyVerifier:
         result["confidence"] = confidence
         result["is_shopify"] = confidence >= MIN_SHOPIFY_CONFIDENCE
 
+        # A page cut off by the safety limit below the threshold is not a
+        # negative verdict; flag it so it is not mistaken for one
+        if truncated and not result["is_shopify"]:
+            result["error"] = f"Inconclusive: page exceeds {VERIFY_MAX_PAGE_BYTES} bytes"
+
         # Log result
         status = "SHOPIFY" if result["is_shopify"] else "NOT SHOPIFY"
         logger.info(f"  {status} (confidence: {confidence}%, signals: {len(signals_found)})")
@@ -334,6 +502,7 @@ class ShopifyVerifier:
         return result
 
 
+@functools.lru_cache(maxsize=100_000)
 def normalize_url(url: str) -> Optional[str]:
     """
     Normalize URL to standard format, handling breadcrumb-style URLs.
@@ -361,7 +530,6 @@ def normalize_url(url: str) -> Optional[str]:
             url = "https://" + url
 
         # Basic validation
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         if not parsed.netloc or "." not in parsed.netloc:
             return None
@@ -372,6 +540,21 @@ def normalize_url(url: str) -> Optional[str]:
         return None
 
 
+def read_json_file(path: Path):
+    """
+    Parse a JSON file from a read-only memory map.
+
+    orjson reads the mapped pages directly, so the file contents are never
+    copied into a Python bytes object first.
+    """
+    with open(path, "rb") as f:
+        # mmap refuses empty files; let orjson report them as invalid JSON
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
 def load_discovered_sites() -> List[str]:
     """Load discovered URLs from discovery output file."""
     urls = []
@@ -381,22 +564,20 @@ def load_discovered_sites() -> List[str]:
         return urls
 
     try:
-        with open(DISCOVERED_SITES_FILE, "r") as f:
-            data = json.load(f)
-
-        # Extract URLs from all discoveries
-        for discovery in data.get("discoveries", []):
-            for url in discovery.get("urls", []):
-                # Normalize URL to handle breadcrumb-style formats
-                normalized = normalize_url(url)
-                if normalized:
-                    urls.append(normalized)
-
-        # Deduplicate
-        urls = list(set(urls))
+        data = read_json_file(DISCOVERED_SITES_FILE)
+
+        # Extract URLs from all discoveries, normalizing breadcrumb-style
+        # formats and deduplicating in the same pass (first-seen order)
+        unique = {
+            normalized: None
+            for discovery in data.get("discoveries", [])
+            for url in discovery.get("urls", [])
+            if (normalized := normalize_url(url))
+        }
+        urls = list(unique)
         logger.info(f"Loaded {len(urls)} unique URLs from discovery file")
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse discovery file: {e}")
 
     return urls
@@ -418,6 +599,12 @@ def main():
         type=str,
         help="Single URL to verify (overrides discovery file)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=16,
+        help="Sites verified in parallel (default: 16)",
+    )
     args = parser.parse_args()
 
     # Determine URLs to verify
@@ -435,33 +622,35 @@ def main():
     rate_limiter = RateLimiter(MIN_REQUEST_DELAY, MAX_REQUEST_DELAY)
     verifier = ShopifyVerifier(ua_rotator, rate_limiter)
 
-    # Verify each URL
-    results = []
-    shopify_sites = []
-
-    total_urls = len(urls)
-    for i, url in enumerate(urls, 1):
-        # Emit progress for pipeline
-        emit_progress(i, total_urls, f"Verifying {url}")
-
-        logger.info(f"[{i}/{total_urls}] Processing {url}")
+    def verify_url(url: str) -> Dict:
         try:
-            result = verifier.verify(url)
-            results.append(result)
-
-            if result["is_shopify"]:
-                shopify_sites.append(result)
-
+            return verifier.verify(url)
         except Exception as e:
             logger.error(f"Error verifying {url}: {e}")
-            results.append({
+            return {
                 "url": url,
                 "is_shopify": False,
                 "confidence": 0,
                 "signals_found": [],
                 "verified_at": datetime.now(timezone.utc).isoformat(),
                 "error": str(e),
-            })
+            }
+
+    # Verify URLs in parallel; map() hands results back in input order
+    results = []
+    shopify_sites = []
+
+    total_urls = len(urls)
+    with ThreadPoolExecutor(max_workers=max(1, min(args.workers, total_urls))) as executor:
+        for i, result in enumerate(executor.map(verify_url, urls), 1):
+            # Emit progress for pipeline
+            emit_progress(i, total_urls, f"Verified {result['url']}")
+
+            logger.info(f"[{i}/{total_urls}] Processed {result['url']}")
+            results.append(result)
+
+            if result["is_shopify"]:
+                shopify_sites.append(result)
 
     # Prepare output
     output = {
@@ -480,8 +669,8 @@ def main():
     SHOPIFY_SITES_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     # Write output
-    with open(SHOPIFY_SITES_FILE, "w") as f:
-        json.dump(output, f, indent=2)
+    with open(SHOPIFY_SITES_FILE, "wb") as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
 
     logger.info(f"Verification complete. Results saved to {SHOPIFY_SITES_FILE}")
 